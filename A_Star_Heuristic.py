@@ -1,4 +1,6 @@
-import heapq
+from Graph import Graph
+from A_star import a_star_graph, a_star_search
+from Landmarks import Landmarks
 
 def input_weighted_tree():
     tree = {}
@@ -27,45 +29,22 @@ def input_heuristics(tree):
         heuristics[node] = int(input(f"Heuristic for node '{node}': "))
     return heuristics
 
-def a_star(tree, heuristics, start, goal):
-    open_list = []
-    heapq.heappush(open_list, (0, start))
-
-    g_scores = {node: float('inf') for node in heuristics}
-    g_scores[start] = 0
-
-    f_scores = {node: float('inf') for node in heuristics}
-    f_scores[start] = heuristics[start]
-
-    came_from = {}
-
-    while open_list:
-        _, current = heapq.heappop(open_list)
-
-        if current == goal:
-            path = []
-            while current in came_from:
-                path.append(current)
-                current = came_from[current]
-            path.append(start)
-            return path[::-1]
-
-        for neighbor, cost in tree.get(current, []):
-            tentative_g_score = g_scores[current] + cost
-
-            if tentative_g_score < g_scores[neighbor]:
-                came_from[neighbor] = current
-                g_scores[neighbor] = tentative_g_score
-                f_scores[neighbor] = tentative_g_score + heuristics[neighbor]
-                heapq.heappush(open_list, (f_scores[neighbor], neighbor))
-
-    return None
+def a_star(tree, heuristics, start, goal, stats=None):
+    if isinstance(tree, Graph):
+        names = tree.names
+        return a_star_graph(tree, start, goal, lambda v: heuristics[names[v]], stats)
+    return a_star_search(lambda node: tree.get(node, []), start, goal, heuristics.__getitem__, stats)
 
 if __name__ == "__main__":
     tree = input_weighted_tree()
-    heuristics = input_heuristics(tree)
+    use_landmarks = input("\nCompute heuristics from ALT landmarks instead of typing them? (y/n): ").strip().lower() == "y"
+    if not use_landmarks:
+        heuristics = input_heuristics(tree)
     start = input("\nEnter start node: ")
     goal = input("Enter goal node: ")
+    if use_landmarks:
+        k = int(input("Enter number of landmarks (default 8): ") or "8")
+        heuristics = Landmarks.build(tree, k).for_goal(goal)
 
     path = a_star(tree, heuristics, start, goal)
     if path:
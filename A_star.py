@@ -1,4 +1,8 @@
-import heapq
+from array import array
+from collections import OrderedDict
+from Graph import Graph, reverse_tree
+from IndexedHeap import IndexedHeap
+from Landmarks import Landmarks
 
 def input_weighted_tree():
     tree = {}
@@ -18,52 +22,289 @@ def input_weighted_tree():
 def heuristic(a, b):
     return abs(ord(a) - ord(b))
 
-def a_star(tree, start, goal):
-    # Gather all nodes including children
-    all_nodes = set(tree.keys())
-    for node in tree:
-        for neighbor, _ in tree[node]:
-            all_nodes.add(neighbor)
-    
-    open_list = []
-    heapq.heappush(open_list, (0, start))
-
-    g_scores = {node: float('inf') for node in all_nodes}
-    g_scores[start] = 0
-
-    f_scores = {node: float('inf') for node in all_nodes}
-    f_scores[start] = heuristic(start, goal)
-
+def a_star_search(neighbors, start, goal, h, stats=None, search_tree=None):
+    # neighbors(node) yields (neighbor, cost); scores are only created for nodes we reach
+    g_scores = {start: 0}
     came_from = {}
+    closed = set()
+    open_list = IndexedHeap()
+    # ties on f go to the deeper node (higher g), which is usually closer to the goal
+    open_list.push(start, (h(start), 0))
+    expansions, pushes, decreases, reopened = 0, 1, 0, 0
+    path = None
 
     while open_list:
-        _, current = heapq.heappop(open_list)
+        current, _ = open_list.pop()
 
         if current == goal:
-            path = []
+            path = [current]
             while current in came_from:
+                current = came_from[current]
                 path.append(current)
+            path.reverse()
+            break
+
+        closed.add(current)
+        expansions += 1
+        current_g = g_scores[current]
+
+        for neighbor, cost in neighbors(current):
+            tentative_g_score = current_g + cost
+
+            if tentative_g_score < g_scores.get(neighbor, float('inf')):
+                came_from[neighbor] = current
+                g_scores[neighbor] = tentative_g_score
+                if neighbor in closed:
+                    # only possible with an inconsistent heuristic
+                    closed.discard(neighbor)
+                    reopened += 1
+                priority = (tentative_g_score + h(neighbor), -tentative_g_score)
+                if open_list.push_or_decrease(neighbor, priority):
+                    pushes += 1
+                else:
+                    decreases += 1
+
+    if stats is not None:
+        stats.update(expansions=expansions, pushes=pushes, decrease_keys=decreases,
+                     reopened=reopened, generated=len(g_scores))
+    if search_tree is not None:
+        search_tree.update(g_scores=g_scores, came_from=came_from, closed=closed)
+    return path
+
+def a_star_graph(graph, start, goal, h, stats=None):
+    # h maps a node id to its estimate; g, parent and closed live in flat arrays indexed by id
+    s = graph.id(start)
+    t = graph.index.get(goal)
+    if t is None:
+        if stats is not None:
+            stats.update(expansions=0, pushes=0, decrease_keys=0, reopened=0, generated=0)
+        return None
+    n = len(graph)
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    inf = float('inf')
+    g_scores = array('d', [inf]) * n
+    g_scores[s] = 0
+    came_from = array('i', [-1]) * n
+    closed = bytearray(n)
+    open_list = IndexedHeap()
+    open_list.push(s, (h(s), 0))
+    expansions, pushes, decreases, reopened, generated = 0, 1, 0, 0, 1
+    path = None
+
+    while open_list:
+        current, _ = open_list.pop()
+
+        if current == t:
+            path = []
+            while current != -1:
+                path.append(graph.names[current])
                 current = came_from[current]
-            path.append(start)
-            return path[::-1]
+            path.reverse()
+            break
+
+        closed[current] = 1
+        expansions += 1
+        current_g = g_scores[current]
 
-        for neighbor, cost in tree.get(current, []):
-            tentative_g_score = g_scores[current] + cost
+        for k in range(offsets[current], offsets[current + 1]):
+            neighbor = targets[k]
+            tentative_g_score = current_g + (weights[k] if weights is not None else 1)
 
             if tentative_g_score < g_scores[neighbor]:
+                if g_scores[neighbor] == inf:
+                    generated += 1
                 came_from[neighbor] = current
                 g_scores[neighbor] = tentative_g_score
-                f_scores[neighbor] = tentative_g_score + heuristic(neighbor, goal)
-                heapq.heappush(open_list, (f_scores[neighbor], neighbor))
+                if closed[neighbor]:
+                    closed[neighbor] = 0
+                    reopened += 1
+                priority = (tentative_g_score + h(neighbor), -tentative_g_score)
+                if open_list.push_or_decrease(neighbor, priority):
+                    pushes += 1
+                else:
+                    decreases += 1
 
-    return None
+    if stats is not None:
+        stats.update(expansions=expansions, pushes=pushes, decrease_keys=decreases,
+                     reopened=reopened, generated=generated)
+    return path
+
+def a_star(tree, start, goal, stats=None, heuristic=heuristic):
+    if isinstance(tree, Graph):
+        names = tree.names
+        return a_star_graph(tree, start, goal, lambda v: heuristic(names[v], goal), stats)
+    return a_star_search(lambda node: tree.get(node, []), start, goal,
+                         lambda node: heuristic(node, goal), stats)
+
+def bidirectional_a_star_search(forward, backward, start, goal, h_forward, h_backward, stats=None):
+    # forward(node) / backward(node) yield (neighbor, cost) along / against edge direction
+    if start == goal:
+        return [start]
+    g = ({start: 0}, {goal: 0})
+    parents = ({}, {})
+    closed = (set(), set())
+    opens = (IndexedHeap(), IndexedHeap())
+    opens[0].push(start, (h_forward(start), 0))
+    opens[1].push(goal, (h_backward(goal), 0))
+    expand = (forward, backward)
+    estimate = (h_forward, h_backward)
+    best, meet = float('inf'), None
+    expansions, pushes = 0, 2
+
+    while opens[0] and opens[1]:
+        # each side's smallest f is a lower bound on any path not yet found
+        # (admissible h), so once either reaches the best meeting cost we are done
+        if opens[0].peek()[1][0] >= best or opens[1].peek()[1][0] >= best:
+            break
+        side = 0 if len(opens[0]) <= len(opens[1]) else 1
+        mine, theirs = g[side], g[1 - side]
+        current, _ = opens[side].pop()
+        closed[side].add(current)
+        expansions += 1
+        current_g = mine[current]
+
+        for neighbor, cost in expand[side](current):
+            tentative_g_score = current_g + cost
+            if tentative_g_score < mine.get(neighbor, float('inf')):
+                mine[neighbor] = tentative_g_score
+                parents[side][neighbor] = current
+                closed[side].discard(neighbor)
+                priority = (tentative_g_score + estimate[side](neighbor), -tentative_g_score)
+                if opens[side].push_or_decrease(neighbor, priority):
+                    pushes += 1
+                if neighbor in theirs and tentative_g_score + theirs[neighbor] < best:
+                    best = tentative_g_score + theirs[neighbor]
+                    meet = neighbor
+
+    if stats is not None:
+        stats.update(expansions=expansions, pushes=pushes, cost=best if meet is not None else None)
+    if meet is None:
+        return None
+    path = [meet]
+    while path[-1] in parents[0]:
+        path.append(parents[0][path[-1]])
+    path.reverse()
+    while path[-1] in parents[1]:
+        path.append(parents[1][path[-1]])
+    return path
+
+def bidirectional_a_star(tree, start, goal, heuristic=heuristic, reverse=None, stats=None):
+    # the backward search estimates d(start, v), hence heuristic(start, v)
+    if isinstance(tree, Graph):
+        reverse = reverse or tree.reverse()
+        s, t = tree.index.get(start), tree.index.get(goal)
+        if s is None or t is None:
+            return [start] if start == goal else None
+        names = tree.names
+        path = bidirectional_a_star_search(tree.edges, reverse.edges, s, t,
+                                           lambda v: heuristic(names[v], goal),
+                                           lambda v: heuristic(start, names[v]), stats)
+        return [names[i] for i in path] if path else None
+    if reverse is None:
+        reverse = reverse_tree(tree)
+    return bidirectional_a_star_search(lambda node: tree.get(node, []), lambda node: reverse.get(node, []),
+                                       start, goal, lambda node: heuristic(node, goal),
+                                       lambda node: heuristic(start, node), stats)
+
+class AStarEngine:
+    def __init__(self, tree, heuristic=heuristic, cache_size=1024, tree_cache_size=64, consistent=False):
+        self.tree = {node: list(children) for node, children in tree.items()}
+        self.heuristic = heuristic
+        # search trees are only reused when the caller vouches that the heuristic is consistent
+        self.consistent = consistent
+        self.cache_size = cache_size
+        self.tree_cache_size = tree_cache_size
+        self.results = OrderedDict()
+        self.search_trees = OrderedDict()
+        self.stats = {"hits": 0, "tree_hits": 0, "misses": 0, "expansions": 0}
+        self.graph = None
+        self._rebuild()
+
+    def _rebuild(self):
+        self.graph = Graph.from_tree(self.tree)
+        self.results.clear()
+        self.search_trees.clear()
+
+    def _remember(self, cache, key, value, limit):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > limit:
+            cache.popitem(last=False)
+
+    def query(self, start, goal):
+        key = (start, goal)
+        if key in self.results:
+            self.results.move_to_end(key)
+            self.stats["hits"] += 1
+            path = self.results[key]
+            return list(path) if path else None
+
+        graph = self.graph
+        s, t = graph.index.get(start), graph.index.get(goal)
+        if s is None or t is None:
+            path = [start] if start == goal else None
+            self._remember(self.results, key, path, self.cache_size)
+            return list(path) if path else None
+
+        # a finished search from the same start has already settled every closed node,
+        # but only a consistent heuristic makes those settled g values optimal
+        cached = self.search_trees.get(s) if self.consistent else None
+        if cached is not None and (t in cached["closed"] or t == s):
+            self.search_trees.move_to_end(s)
+            self.stats["tree_hits"] += 1
+            came_from = cached["came_from"]
+            ids = [t]
+            while ids[-1] in came_from:
+                ids.append(came_from[ids[-1]])
+            path = [graph.names[i] for i in reversed(ids)]
+        else:
+            self.stats["misses"] += 1
+            names = graph.names
+            run, search_tree = {}, {}
+            ids = a_star_search(graph.edges, s, t, lambda v: self.heuristic(names[v], goal),
+                                run, search_tree)
+            self.stats["expansions"] += run["expansions"]
+            if self.consistent:
+                self._remember(self.search_trees, s, search_tree, self.tree_cache_size)
+            path = [names[i] for i in ids] if ids else None
+
+        self._remember(self.results, key, path, self.cache_size)
+        return list(path) if path else None
+
+    def set_edge(self, node, child, cost):
+        children = self.tree.setdefault(node, [])
+        for i, (c, _) in enumerate(children):
+            if c == child:
+                children[i] = (child, cost)
+                break
+        else:
+            children.append((child, cost))
+        self._rebuild()
+
+    def remove_edge(self, node, child):
+        children = self.tree.get(node, [])
+        self.tree[node] = [(c, w) for c, w in children if c != child]
+        self._rebuild()
+
+    def update_edges(self, changes):
+        # batch of (node, child, cost) with cost None meaning removal; rebuilds once
+        for node, child, cost in changes:
+            children = [(c, w) for c, w in self.tree.get(node, []) if c != child]
+            if cost is not None:
+                children.append((child, cost))
+            self.tree[node] = children
+        self._rebuild()
 
 if __name__ == "__main__":
     tree = input_weighted_tree()
     start = input("Enter start node: ")
     goal = input("Enter goal node: ")
+    k = int(input("Enter number of ALT landmarks (0 for the default heuristic): ") or "0")
 
-    path = a_star(tree, start, goal)
+    if k > 0:
+        path = a_star(tree, start, goal, heuristic=Landmarks.build(tree, k).heuristic)
+    else:
+        path = a_star(tree, start, goal)
     if path:
         print("A* Path:", " -> ".join(path))
     else:
@@ -1,6 +1,63 @@
 from collections import deque
+import numpy as np
+from Graph import Graph, reverse_tree
+
+def bfs_graph(graph, start):
+    offsets, targets = graph.offsets, graph.targets
+    s = graph.id(start)
+    visited = bytearray(len(graph))
+    visited[s] = 1
+    queue = deque([s])
+    order = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for k in range(offsets[node], offsets[node + 1]):
+            neighbor = targets[k]
+            if not visited[neighbor]:
+                visited[neighbor] = 1
+                queue.append(neighbor)
+    return [graph.names[i] for i in order]
+
+def walk_bfs(successors, sources, seen, mark, goal=None):
+    # yields (node, depth, parent) level by level from all sources at once
+    queue = deque()
+    for source in sources:
+        if not seen(source):
+            mark(source)
+            queue.append((source, 0, None))
+    while queue:
+        node, depth, parent = queue.popleft()
+        yield node, depth, parent
+        if goal is not None and goal(node):
+            return
+        for neighbor in successors(node):
+            if not seen(neighbor):
+                mark(neighbor)
+                queue.append((neighbor, depth + 1, node))
+
+def iter_bfs(tree, sources, with_info=False, goal=None):
+    if isinstance(tree, Graph):
+        names = tree.names
+        visited = bytearray(len(tree))
+        walk = walk_bfs(tree.neighbors, [tree.id(s) for s in sources], visited.__getitem__,
+                        lambda i: visited.__setitem__(i, 1),
+                        None if goal is None else (lambda i: goal(names[i])))
+        for node, depth, parent in walk:
+            if with_info:
+                yield names[node], depth, None if parent is None else names[parent]
+            else:
+                yield names[node]
+        return
+
+    visited = set()
+    walk = walk_bfs(lambda node: tree.get(node, []), sources, visited.__contains__, visited.add, goal)
+    for node, depth, parent in walk:
+        yield (node, depth, parent) if with_info else node
 
 def bfs(tree, start):
+    if isinstance(tree, Graph):
+        return bfs_graph(tree, start)
     visited = set()
     queue = deque([start])
     visited.add(start)
@@ -14,6 +71,130 @@ def bfs(tree, start):
                 queue.append(neighbor)
     return order
 
+def csr_arrays(graph):
+    # zero-copy NumPy views over the Graph's array.array buffers
+    offsets = np.frombuffer(graph.offsets, dtype=np.int64)
+    targets = np.frombuffer(graph.targets, dtype=np.int32) if len(graph.targets) else np.zeros(0, np.int32)
+    return offsets, targets
+
+def gather_edges(offsets, targets, nodes):
+    # targets of every edge leaving nodes, plus the index of the node each came from
+    starts = offsets[nodes]
+    counts = offsets[nodes + 1] - starts
+    total = int(counts.sum())
+    if total == 0:
+        return np.zeros(0, np.int32), np.zeros(0, np.int64)
+    owner = np.repeat(np.arange(len(nodes)), counts)
+    first = np.cumsum(counts) - counts
+    return targets[np.arange(total) - first[owner] + starts[owner]], owner
+
+def bfs_levels(tree, start, reverse=None, alpha=14, beta=24, stats=None):
+    # level-synchronous BFS that flips between pushing from the frontier (top-down)
+    # and pulling into unvisited nodes from their predecessors (bottom-up)
+    graph = tree if isinstance(tree, Graph) else Graph.from_tree(tree)
+    reverse = reverse or graph.reverse()
+    n = len(graph)
+    offsets, targets = csr_arrays(graph)
+    r_offsets, r_targets = csr_arrays(reverse)
+    out_degree = np.diff(offsets)
+    in_degree = np.diff(r_offsets)
+
+    levels = np.full(n, -1, dtype=np.int32)
+    visited = np.zeros(n, dtype=bool)
+    s = graph.id(start)
+    levels[s] = 0
+    visited[s] = True
+    frontier = np.array([s], dtype=np.int64)
+    unexplored_edges = int(out_degree.sum()) - int(out_degree[s])
+    bottom_up = False
+    steps = []
+    level = 0
+
+    while len(frontier):
+        frontier_edges = int(out_degree[frontier].sum())
+        if not bottom_up and frontier_edges > unexplored_edges / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        if bottom_up:
+            in_frontier = np.zeros(n, dtype=bool)
+            in_frontier[frontier] = True
+            candidates = np.flatnonzero(~visited & (in_degree > 0))
+            preds, owner = gather_edges(r_offsets, r_targets, candidates)
+            nxt = np.unique(candidates[owner[in_frontier[preds]]])
+        else:
+            succs, _ = gather_edges(offsets, targets, frontier)
+            nxt = np.unique(succs[~visited[succs]]).astype(np.int64)
+
+        level += 1
+        visited[nxt] = True
+        levels[nxt] = level
+        unexplored_edges -= int(out_degree[nxt].sum())
+        steps.append("bottom-up" if bottom_up else "top-down")
+        frontier = nxt
+
+    if stats is not None:
+        stats["steps"] = steps
+    return levels
+
+def bidirectional_search(forward, backward, start, goal):
+    # forward(node) / backward(node) list successors / predecessors
+    if start == goal:
+        return [start]
+    parents = ({start: None}, {goal: None})
+    depths = ({start: 0}, {goal: 0})
+    frontiers = [[start], [goal]]
+    expand = (forward, backward)
+
+    while frontiers[0] and frontiers[1]:
+        # grow whichever side currently has the smaller frontier by one full level
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, theirs = depths[side], depths[1 - side]
+        next_frontier = []
+        meet, meet_len = None, None
+        for node in frontiers[side]:
+            for neighbor in expand[side](node):
+                if neighbor in mine:
+                    continue
+                parents[side][neighbor] = node
+                mine[neighbor] = mine[node] + 1
+                next_frontier.append(neighbor)
+                if neighbor in theirs:
+                    length = mine[neighbor] + theirs[neighbor]
+                    if meet is None or length < meet_len:
+                        meet, meet_len = neighbor, length
+        if meet is not None:
+            return join_paths(parents[0], parents[1], meet)
+        frontiers[side] = next_frontier
+    return None
+
+def join_paths(forward_parents, backward_parents, meet):
+    path = []
+    node = meet
+    while node is not None:
+        path.append(node)
+        node = forward_parents[node]
+    path.reverse()
+    node = backward_parents[meet]
+    while node is not None:
+        path.append(node)
+        node = backward_parents[node]
+    return path
+
+def bidirectional_bfs(tree, start, goal, reverse=None):
+    if isinstance(tree, Graph):
+        reverse = reverse or tree.reverse()
+        s, t = tree.index.get(start), tree.index.get(goal)
+        if s is None or t is None:
+            return [start] if start == goal else None
+        path = bidirectional_search(tree.neighbors, reverse.neighbors, s, t)
+        return [tree.names[i] for i in path] if path else None
+    if reverse is None:
+        reverse = reverse_tree(tree)
+    return bidirectional_search(lambda node: tree.get(node, []), lambda node: reverse.get(node, []),
+                                start, goal)
+
 def main():
     n = int(input("Enter number of nodes: "))
     print("Enter each node and its children (space-separated)")
@@ -0,0 +1,215 @@
+import heapq
+import math
+
+class KDTreeIndex:
+    # bucketed 2-d tree with tight bounding boxes and live-point counts, so deleted
+    # points and empty subtrees are skipped; the splits follow the data, which keeps
+    # queries logarithmic on clustered inputs where a uniform grid degenerates
+    def __init__(self, coords, ids=None, leaf_size=8):
+        self.coords = coords
+        self.leaf_size = leaf_size
+        self.lo, self.hi, self.parent, self.count = [], [], [], []
+        self.children, self.points = [], []
+        self.leaf_of = {}
+        ids = list(range(len(coords))) if ids is None else list(ids)
+        self.size = len(ids)
+        if ids:
+            self._build(ids, -1)
+
+    def _build(self, ids, parent):
+        coords = self.coords
+        node = len(self.count)
+        xs = [coords[i][0] for i in ids]
+        ys = [coords[i][1] for i in ids]
+        self.lo.append((min(xs), min(ys)))
+        self.hi.append((max(xs), max(ys)))
+        self.parent.append(parent)
+        self.count.append(len(ids))
+        self.children.append(None)
+        if len(ids) <= self.leaf_size:
+            self.points.append(ids)
+            for i in ids:
+                self.leaf_of[i] = node
+            return node
+        self.points.append(None)
+        axis = 0 if self.hi[node][0] - self.lo[node][0] >= self.hi[node][1] - self.lo[node][1] else 1
+        ids.sort(key=lambda i: coords[i][axis])
+        mid = len(ids) // 2
+        left = self._build(ids[:mid], node)
+        self.children[node] = (left, self._build(ids[mid:], node))
+        return node
+
+    def remove(self, i):
+        node = self.leaf_of.pop(i, None)
+        if node is None:
+            return
+        self.points[node].remove(i)
+        while node != -1:
+            self.count[node] -= 1
+            node = self.parent[node]
+        self.size -= 1
+
+    def box_distance(self, node, x, y):
+        (lx, ly), (hx, hy) = self.lo[node], self.hi[node]
+        dx = lx - x if x < lx else (x - hx if x > hx else 0.0)
+        dy = ly - y if y < ly else (y - hy if y > hy else 0.0)
+        return math.hypot(dx, dy)
+
+    def nearest(self, i, k=1):
+        # depth-first, nearer child first; a subtree is skipped once its box is
+        # no closer than the current k-th best
+        if self.size == 0 or k < 1:
+            return []
+        coords, count = self.coords, self.count
+        x, y = coords[i]
+        best = []
+        stack = [(0.0, 0)]
+        while stack:
+            d_box, node = stack.pop()
+            if len(best) == k and d_box >= -best[0][0]:
+                continue
+            points = self.points[node]
+            if points is not None:
+                for j in points:
+                    if j == i:
+                        continue
+                    d = math.hypot(coords[j][0] - x, coords[j][1] - y)
+                    if len(best) < k:
+                        heapq.heappush(best, (-d, j))
+                    elif d < -best[0][0]:
+                        heapq.heapreplace(best, (-d, j))
+                continue
+            # push the farther child first so the nearer one is searched first
+            children = [(self.box_distance(c, x, y), c) for c in self.children[node] if count[c]]
+            for d, c in sorted(children, reverse=True):
+                if len(best) < k or d < -best[0][0]:
+                    stack.append((d, c))
+        return [j for _, j in sorted(best, reverse=True)]
+
+def nearest_neighbor_tour(coords, start=0):
+    n = len(coords)
+    if n == 0:
+        return []
+    index = KDTreeIndex(coords)
+    tour = [start]
+    index.remove(start)
+    while index.size:
+        nxt = index.nearest(tour[-1])[0]
+        index.remove(nxt)
+        tour.append(nxt)
+    return tour
+
+def nearest_neighbor_matrix_tour(dist, start=0):
+    n = len(dist)
+    unvisited = set(range(n))
+    unvisited.discard(start)
+    tour = [start]
+    while unvisited:
+        row = dist[tour[-1]]
+        nxt = min(unvisited, key=row.__getitem__)
+        unvisited.remove(nxt)
+        tour.append(nxt)
+    return tour
+
+def greedy_edge_tour(coords, k=10):
+    n = len(coords)
+    if n < 3:
+        return list(range(n))
+    index = KDTreeIndex(coords)
+    edges = set()
+    for i in range(n):
+        for j in index.nearest(i, min(k, n - 1)):
+            edges.add((min(i, j), max(i, j)))
+    edges = sorted(edges, key=lambda e: math.dist(coords[e[0]], coords[e[1]]))
+
+    parent = list(range(n))
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    adj = [[] for _ in range(n)]
+    for a, b in edges:
+        if len(adj[a]) < 2 and len(adj[b]) < 2:
+            ra, rb = find(a), find(b)
+            if ra != rb:
+                parent[ra] = rb
+                adj[a].append(b)
+                adj[b].append(a)
+
+    # the accepted edges form vertex-disjoint paths; walk each from one end
+    fragments = []
+    seen = [False] * n
+    for i in range(n):
+        if seen[i] or len(adj[i]) == 2:
+            continue
+        path = [i]
+        seen[i] = True
+        prev, cur = None, i
+        while True:
+            nxt = [c for c in adj[cur] if c != prev]
+            if not nxt:
+                break
+            prev, cur = cur, nxt[0]
+            seen[cur] = True
+            path.append(cur)
+        fragments.append(path)
+    return join_fragments(coords, fragments)
+
+def join_fragments(coords, fragments):
+    if len(fragments) == 1:
+        return fragments[0]
+    owner = {}
+    for f, path in enumerate(fragments):
+        owner[path[0]] = f
+        owner[path[-1]] = f
+    index = KDTreeIndex(coords, owner.keys())
+
+    tour = list(fragments[0])
+    index.remove(tour[0])
+    index.remove(tour[-1])
+    while index.size:
+        end = index.nearest(tour[-1])[0]
+        path = fragments[owner[end]]
+        index.remove(path[0])
+        index.remove(path[-1])
+        tour.extend(path if end == path[0] else reversed(path))
+    return tour
+
+def hilbert_index(order, x, y):
+    side = 1 << order
+    d = 0
+    s = side >> 1
+    while s:
+        rx = 1 if x & s else 0
+        ry = 1 if y & s else 0
+        d += s * s * ((3 * rx) ^ ry)
+        if ry == 0:
+            if rx == 1:
+                x, y = side - 1 - x, side - 1 - y
+            x, y = y, x
+        s >>= 1
+    return d
+
+def space_filling_curve_tour(coords, order=16):
+    n = len(coords)
+    if n == 0:
+        return []
+    min_x = min(c[0] for c in coords)
+    min_y = min(c[1] for c in coords)
+    width = max(max(c[0] for c in coords) - min_x, max(c[1] for c in coords) - min_y) or 1.0
+    scale = ((1 << order) - 1) / width
+    keys = [hilbert_index(order, int((x - min_x) * scale), int((y - min_y) * scale)) for x, y in coords]
+    return sorted(range(n), key=keys.__getitem__)
+
+CONSTRUCTIONS = {
+    "nearest": nearest_neighbor_tour,
+    "greedy": greedy_edge_tour,
+    "sfc": space_filling_curve_tour,
+}
+
+def build_tour(coords, method="greedy", start=0):
+    if method == "nearest":
+        return nearest_neighbor_tour(coords, start)
+    return CONSTRUCTIONS[method](coords)
\ No newline at end of file
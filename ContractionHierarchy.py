@@ -0,0 +1,241 @@
+import heapq
+import struct
+from array import array
+from Graph import Graph, encode_names, decode_names
+
+INF = float('inf')
+MAGIC = b'CH02'
+
+def _witness_search(out_edges, source, skip, max_cost, limit):
+    # bounded Dijkstra in the not-yet-contracted graph, never passing through skip
+    dist = {source: 0}
+    heap = [(0, source)]
+    settled = 0
+    while heap and settled < limit:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        if d > max_cost:
+            break
+        settled += 1
+        for w, (cost, _) in out_edges[u].items():
+            if w == skip:
+                continue
+            nd = d + cost
+            if nd < dist.get(w, INF):
+                dist[w] = nd
+                heapq.heappush(heap, (nd, w))
+    return dist
+
+def _shortcuts(out_edges, in_edges, v, limit):
+    found = []
+    for u, (c_uv, _) in in_edges[v].items():
+        targets = {w: c_uv + c_vw for w, (c_vw, _) in out_edges[v].items() if w != u}
+        if not targets:
+            continue
+        dist = _witness_search(out_edges, u, v, max(targets.values()), limit)
+        for w, cost in targets.items():
+            if dist.get(w, INF) > cost:
+                found.append((u, w, cost))
+    return found
+
+def _to_csr(n, edge_maps):
+    offsets = array('q', [0]) * (n + 1)
+    targets, costs, mids = array('i'), array('d'), array('i')
+    for u in range(n):
+        for w, (cost, mid) in edge_maps[u].items():
+            targets.append(w)
+            costs.append(cost)
+            mids.append(-1 if mid is None else mid)
+        offsets[u + 1] = len(targets)
+    return offsets, targets, costs, mids
+
+class ContractionHierarchy:
+    def __init__(self, names, rank, up, down):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.rank = rank
+        # up: edges u -> w with rank[w] > rank[u], searched forward from the start
+        # down: edges u -> w with rank[u] > rank[w], stored at w and searched backward from the goal
+        self.up = up
+        self.down = down
+
+    @classmethod
+    def build(cls, tree, witness_limit=500):
+        graph = tree if isinstance(tree, Graph) else Graph.from_tree(tree)
+        n = len(graph)
+        out_edges = [{} for _ in range(n)]
+        in_edges = [{} for _ in range(n)]
+        for u in range(n):
+            for w, cost in graph.edges(u):
+                if w != u and cost < out_edges[u].get(w, (INF, None))[0]:
+                    out_edges[u][w] = (cost, None)
+                    in_edges[w][u] = (cost, None)
+
+        deleted_neighbors = [0] * n
+        def priority(v):
+            added = len(_shortcuts(out_edges, in_edges, v, witness_limit))
+            return added - len(out_edges[v]) - len(in_edges[v]) + deleted_neighbors[v]
+
+        heap = [(priority(v), v) for v in range(n)]
+        heapq.heapify(heap)
+        rank = array('i', [0]) * n
+        up_maps = [{} for _ in range(n)]
+        down_maps = [{} for _ in range(n)]
+        contracted = bytearray(n)
+        level = 0
+        while heap:
+            _, v = heapq.heappop(heap)
+            if contracted[v]:
+                continue
+            # lazy update: re-evaluate and put back if it is no longer the cheapest
+            p = priority(v)
+            if heap and p > heap[0][0]:
+                heapq.heappush(heap, (p, v))
+                continue
+
+            for u, w, cost in _shortcuts(out_edges, in_edges, v, witness_limit):
+                if cost < out_edges[u].get(w, (INF, None))[0]:
+                    out_edges[u][w] = (cost, v)
+                    in_edges[w][u] = (cost, v)
+
+            rank[v] = level
+            level += 1
+            contracted[v] = 1
+            for w, edge in out_edges[v].items():
+                up_maps[v][w] = edge
+                del in_edges[w][v]
+                deleted_neighbors[w] += 1
+            for u, edge in in_edges[v].items():
+                down_maps[v][u] = edge
+                del out_edges[u][v]
+                deleted_neighbors[u] += 1
+            out_edges[v] = {}
+            in_edges[v] = {}
+
+        return cls(list(graph.names), rank, _to_csr(n, up_maps), _to_csr(n, down_maps))
+
+    def _edge_mid(self, a, b):
+        if self.rank[b] > self.rank[a]:
+            offsets, targets, _, mids = self.up
+            u, w = a, b
+        else:
+            offsets, targets, _, mids = self.down
+            u, w = b, a
+        for k in range(offsets[u], offsets[u + 1]):
+            if targets[k] == w:
+                return mids[k]
+        raise KeyError((a, b))
+
+    def _unpack(self, ids):
+        path = [ids[0]]
+        for a, b in zip(ids, ids[1:]):
+            stack = [(a, b)]
+            while stack:
+                x, y = stack.pop()
+                mid = self._edge_mid(x, y)
+                if mid == -1:
+                    path.append(y)
+                else:
+                    stack.append((mid, y))
+                    stack.append((x, mid))
+        return path
+
+    def query_ids(self, s, t):
+        if s == t:
+            return 0, [s]
+        dist = ({s: 0}, {t: 0})
+        parent = ({}, {})
+        heaps = ([(0, s)], [(0, t)])
+        graphs = (self.up, self.down)
+        best, meet = INF, None
+        while heaps[0] or heaps[1]:
+            for side in (0, 1):
+                heap = heaps[side]
+                # a side can stop once nothing left in it beats the best meeting
+                if not heap or heap[0][0] >= best:
+                    heap.clear()
+                    continue
+                d, u = heapq.heappop(heap)
+                if d > dist[side][u]:
+                    continue
+                if u in dist[1 - side] and d + dist[1 - side][u] < best:
+                    best, meet = d + dist[1 - side][u], u
+                offsets, targets, costs, _ = graphs[side]
+                for k in range(offsets[u], offsets[u + 1]):
+                    w = targets[k]
+                    nd = d + costs[k]
+                    if nd < dist[side].get(w, INF):
+                        dist[side][w] = nd
+                        parent[side][w] = u
+                        heapq.heappush(heap, (nd, w))
+        if meet is None:
+            return None, None
+
+        ids = [meet]
+        while ids[-1] in parent[0]:
+            ids.append(parent[0][ids[-1]])
+        ids.reverse()
+        while ids[-1] in parent[1]:
+            ids.append(parent[1][ids[-1]])
+        return best, self._unpack(ids)
+
+    def query(self, start, goal):
+        s, t = self.index.get(start), self.index.get(goal)
+        if s is None or t is None:
+            return [start] if start == goal else None
+        _, ids = self.query_ids(s, t)
+        return [self.names[i] for i in ids] if ids else None
+
+    def query_cost(self, start, goal):
+        s, t = self.index.get(start), self.index.get(goal)
+        if s is None or t is None:
+            return 0 if start == goal else None
+        cost, _ = self.query_ids(s, t)
+        return cost
+
+    def save(self, path):
+        blob = encode_names(self.names)
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<qqqq', len(self.names), len(self.up[1]), len(self.down[1]), len(blob)))
+            f.write(blob)
+            self.rank.tofile(f)
+            for offsets, targets, costs, mids in (self.up, self.down):
+                offsets.tofile(f)
+                targets.tofile(f)
+                costs.tofile(f)
+                mids.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"{path} is not a contraction hierarchy file")
+            n, m_up, m_down, blob_len = struct.unpack('<qqqq', f.read(32))
+            names = decode_names(f.read(blob_len))
+            rank = array('i')
+            rank.fromfile(f, n)
+            parts = []
+            for m in (m_up, m_down):
+                offsets, targets, costs, mids = array('q'), array('i'), array('d'), array('i')
+                offsets.fromfile(f, n + 1)
+                targets.fromfile(f, m)
+                costs.fromfile(f, m)
+                mids.fromfile(f, m)
+                parts.append((offsets, targets, costs, mids))
+        return cls(names, rank, parts[0], parts[1])
+
+if __name__ == "__main__":
+    from A_star import input_weighted_tree
+    tree = input_weighted_tree()
+    ch = ContractionHierarchy.build(tree)
+    start = input("Enter start node: ")
+    goal = input("Enter goal node: ")
+
+    path = ch.query(start, goal)
+    if path:
+        print("CH Path:", " -> ".join(path))
+        print("Cost:", ch.query_cost(start, goal))
+    else:
+        print("No path found.")
\ No newline at end of file
@@ -0,0 +1,88 @@
+import numpy as np
+
+def cut_points(n, rng):
+    start, end = np.sort(rng.choice(n, 2, replace=False))
+    return int(start), int(end)
+
+def segment_crossover(a, b, rng):
+    n = len(a)
+    start, end = cut_points(n, rng)
+    taken = np.zeros(n, dtype=bool)
+    taken[a[start:end]] = True
+    return np.concatenate((a[start:end], b[~taken[b]]))
+
+def order_crossover(a, b, rng):
+    n = len(a)
+    start, end = cut_points(n, rng)
+    child = np.empty_like(a)
+    child[start:end] = a[start:end]
+    taken = np.zeros(n, dtype=bool)
+    taken[a[start:end]] = True
+    rest = np.roll(b, -end)
+    rest = rest[~taken[rest]]
+    child[(end + np.arange(len(rest))) % n] = rest
+    return child
+
+def pmx_crossover(a, b, rng):
+    n = len(a)
+    start, end = cut_points(n, rng)
+    child = b.copy()
+    child[start:end] = a[start:end]
+    taken = np.zeros(n, dtype=bool)
+    taken[a[start:end]] = True
+    pos_b = np.empty(n, dtype=np.intp)
+    pos_b[b] = np.arange(n)
+    # each displaced city of b's segment follows its own (disjoint) mapping chain
+    for i in range(start, end):
+        city = b[i]
+        if taken[city]:
+            continue
+        j = i
+        while start <= j < end:
+            j = pos_b[a[j]]
+        child[j] = city
+    return child
+
+def edge_recombination(a, b, rng):
+    n = len(a)
+    adj = [set() for _ in range(n)]
+    for parent in (a.tolist(), b.tolist()):
+        for i, city in enumerate(parent):
+            adj[city].add(parent[i - 1])
+            adj[city].add(parent[(i + 1) % n])
+
+    unvisited = list(range(n))
+    slot = list(range(n))
+
+    def visit(city):
+        # O(1) removal: move the last unvisited city into this city's slot
+        k = slot[city]
+        last = unvisited.pop()
+        if last != city:
+            unvisited[k] = last
+            slot[last] = k
+        for nb in adj[city]:
+            adj[nb].discard(city)
+
+    child = np.empty_like(a)
+    current = int(a[0])
+    for k in range(n):
+        child[k] = current
+        visit(current)
+        if not unvisited:
+            break
+        options = adj[current]
+        if options:
+            fewest = min(len(adj[c]) for c in options)
+            best = [c for c in options if len(adj[c]) == fewest]
+            current = best[rng.integers(len(best))] if len(best) > 1 else best[0]
+        else:
+            current = unvisited[rng.integers(len(unvisited))]
+    return child
+
+CROSSOVERS = {
+    "segment": segment_crossover,
+    "ox": order_crossover,
+    "pmx": pmx_crossover,
+    "erx": edge_recombination,
+}
\ No newline at end of file
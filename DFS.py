@@ -1,16 +1,74 @@
-def dfs(tree, start):
-    visited = set()
-    order = []
+from Graph import Graph
+
+def dfs_graph(graph, start):
+    offsets, targets = graph.offsets, graph.targets
+    s = graph.id(start)
+    visited = bytearray(len(graph))
+    visited[s] = 1
+    order = [s]
+    # (node, next edge slot) frames reproduce the recursive visiting order
+    stack = [(s, offsets[s])]
+    while stack:
+        node, k = stack[-1]
+        end = offsets[node + 1]
+        while k < end and visited[targets[k]]:
+            k += 1
+        if k == end:
+            stack.pop()
+            continue
+        stack[-1] = (node, k + 1)
+        child = targets[k]
+        visited[child] = 1
+        order.append(child)
+        stack.append((child, offsets[child]))
+    return [graph.names[i] for i in order]
+
+def walk_dfs(successors, sources, seen, mark, goal=None):
+    # yields (node, depth, parent) in recursive preorder without recursing
+    for source in sources:
+        if seen(source):
+            continue
+        mark(source)
+        yield source, 0, None
+        if goal is not None and goal(source):
+            return
+        stack = [(source, iter(successors(source)))]
+        while stack:
+            node, children = stack[-1]
+            for child in children:
+                if not seen(child):
+                    mark(child)
+                    yield child, len(stack), node
+                    if goal is not None and goal(child):
+                        return
+                    stack.append((child, iter(successors(child))))
+                    break
+            else:
+                stack.pop()
 
-    def dfs(node):
-        visited.add(node)
-        order.append(node)
-        for neighbor in tree.get(node, []):
-            if neighbor not in visited:
-                dfs(neighbor)
+def iter_dfs(tree, sources, with_info=False, goal=None):
+    if isinstance(tree, Graph):
+        names = tree.names
+        visited = bytearray(len(tree))
+        walk = walk_dfs(tree.neighbors, [tree.id(s) for s in sources], visited.__getitem__,
+                        lambda i: visited.__setitem__(i, 1),
+                        None if goal is None else (lambda i: goal(names[i])))
+        for node, depth, parent in walk:
+            if with_info:
+                yield names[node], depth, None if parent is None else names[parent]
+            else:
+                yield names[node]
+        return
 
-    dfs(start)
-    return order
+    visited = set()
+    walk = walk_dfs(lambda node: tree.get(node, []), sources, visited.__contains__, visited.add, goal)
+    for node, depth, parent in walk:
+        yield (node, depth, parent) if with_info else node
+
+def dfs(tree, start):
+    if isinstance(tree, Graph):
+        return dfs_graph(tree, start)
+    return list(iter_dfs(tree, [start]))
 
 def main():
     n = int(input("Enter number of nodes: "))
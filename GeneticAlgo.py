@@ -1,4 +1,5 @@
 import random
+import numpy as np
 
 population = [
     [1, 0, 1, 0, 1, 0, 0, 0, 1, 0],
@@ -12,10 +13,13 @@ population = [
 def fitness(individual):
     return sum(individual)
 
-def select(population):
-    selected = random.sample(population, 3)
-    selected.sort(key=fitness, reverse=True)
-    return selected[0]
+def select(population, scores=None):
+    # scores[i] is fitness(population[i]), computed once per generation by the caller;
+    # without them only the three contestants are scored
+    picks = random.sample(range(len(population)), 3)
+    if scores is None:
+        return population[max(picks, key=lambda i: fitness(population[i]))]
+    return population[max(picks, key=scores.__getitem__)]
 
 def crossover(p1, p2):
     if random.random() < 0.7:
@@ -32,19 +36,109 @@ def mutate(individual):
 def genetic_algorithm():
     global population
 
+    scores = [fitness(ind) for ind in population]
     for gen in range(20):
         new_population = []
         while len(new_population) < len(population):
-            p1 = select(population)
-            p2 = select(population)
+            p1 = select(population, scores)
+            p2 = select(population, scores)
             c1, c2 = crossover(p1, p2)
             new_population.append(mutate(c1))
             new_population.append(mutate(c2))
 
         population = new_population[:len(population)]
-        best = max(population, key=fitness)
-        print(f"Gen {gen}: Best = {best}, Fitness = {fitness(best)}")
+        scores = [fitness(ind) for ind in population]
+        top = max(range(len(population)), key=scores.__getitem__)
+        best = population[top]
+        print(f"Gen {gen}: Best = {best}, Fitness = {scores[top]}")
 
-    print("\nFinal Best:", best, "\nwith fitness", fitness(best))
+    print("\nFinal Best:", best, "\nwith fitness", scores[top])
 
-genetic_algorithm()
\ No newline at end of file
+WORD = 64
+ALL_ONES = np.uint64(0xFFFFFFFFFFFFFFFF)
+# bits set in each byte value, for numpy builds without bitwise_count
+BYTE_COUNTS = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+def pack(population):
+    # rows of 0/1 -> rows of little-endian uint64 words, padding bits left at zero
+    bits = np.asarray(population, dtype=np.uint8)
+    words = -(-bits.shape[1] // WORD)
+    padded = np.zeros((bits.shape[0], words * WORD), dtype=np.uint8)
+    padded[:, :bits.shape[1]] = bits
+    return np.packbits(padded, axis=1, bitorder="little").view("<u8").astype(np.uint64)
+
+def unpack(words, n_bits):
+    as_bytes = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(as_bytes, axis=-1, count=n_bits, bitorder="little")
+
+def popcount(words):
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return BYTE_COUNTS[np.ascontiguousarray(words).view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+def random_bitstrings(pop_size, n_bits, rng):
+    words = rng.integers(0, ALL_ONES, (pop_size, -(-n_bits // WORD)), dtype=np.uint64, endpoint=True)
+    if n_bits % WORD:
+        words[:, -1] &= np.uint64((1 << (n_bits % WORD)) - 1)
+    return words
+
+def tournament_select(scores, count, rng, size=3):
+    # one row of contestants per pick; the fittest of each row wins
+    contestants = rng.integers(0, len(scores), (count, size))
+    return contestants[np.arange(count), np.argmax(scores[contestants], axis=1)]
+
+def prefix_masks(points, words):
+    # per row: ones on the bits below points[row], zeros above
+    index = np.arange(words, dtype=np.int64) * WORD
+    shift = np.clip(points[:, None] - index, 0, WORD)
+    partial = (np.uint64(1) << np.minimum(shift, WORD - 1).astype(np.uint64)) - np.uint64(1)
+    return np.where(shift >= WORD, ALL_ONES, partial)
+
+def mask_crossover(a, b, n_bits, rate, rng, kind="one_point"):
+    count, words = a.shape
+    if kind == "uniform":
+        mask = rng.integers(0, ALL_ONES, (count, words), dtype=np.uint64, endpoint=True)
+    else:
+        mask = prefix_masks(rng.integers(1, max(n_bits, 2), count), words)
+    # pairs that skip crossover copy their parents unchanged
+    mask[rng.random(count) >= rate] = ALL_ONES
+    return (a & mask) | (b & ~mask), (b & mask) | (a & ~mask)
+
+def geometric_mutation(words, n_bits, rate, rng):
+    # jump straight from one flipped bit to the next instead of drawing per bit
+    total = words.shape[0] * n_bits
+    if rate <= 0 or total == 0:
+        return 0
+    positions = []
+    last = -1
+    while last < total:
+        batch = int(total * rate * 1.1) + 16
+        jumps = np.cumsum(rng.geometric(rate, batch)) + last
+        positions.append(jumps[jumps < total])
+        last = int(jumps[-1])
+    positions = np.concatenate(positions)
+    rows, bits = np.divmod(positions, n_bits)
+    np.bitwise_xor.at(words, (rows, bits // WORD), np.uint64(1) << (bits % WORD).astype(np.uint64))
+    return len(positions)
+
+def bitstring_ga(n_bits, pop_size=100, generations=20, crossover_rate=0.7, mutation_rate=0.01,
+                 tournament=3, crossover="one_point", seed=None, population=None, score=popcount):
+    rng = np.random.default_rng(seed)
+    words = pack(population) if population is not None else random_bitstrings(pop_size, n_bits, rng)
+    pop_size = len(words)
+    scores = score(words)
+    history = []
+    for _ in range(generations):
+        half = (pop_size + 1) // 2
+        parents = tournament_select(scores, 2 * half, rng, tournament)
+        c1, c2 = mask_crossover(words[parents[:half]], words[parents[half:]], n_bits, crossover_rate, rng,
+                                crossover)
+        words = np.concatenate((c1, c2))[:pop_size]
+        geometric_mutation(words, n_bits, mutation_rate, rng)
+        scores = score(words)
+        history.append(int(scores.max()))
+    best = int(np.argmax(scores))
+    return unpack(words[best], n_bits), int(scores[best]), history
+
+if __name__ == "__main__":
+    genetic_algorithm()
\ No newline at end of file
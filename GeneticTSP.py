@@ -1,5 +1,15 @@
-import random
 import math
+import os
+import queue
+import time
+import traceback
+from collections import OrderedDict
+import multiprocessing as mp
+from multiprocessing import shared_memory
+import numpy as np
+from Crossover_TSP import CROSSOVERS
+from Construction_TSP import build_tour, nearest_neighbor_matrix_tour
+from Moves_TSP import swap_delta, apply_swap
 
 def distance(a, b):
     return math.hypot(a[0]-b[0], a[1]-b[1])
@@ -7,42 +17,298 @@ def distance(a, b):
 def path_length(path, coords):
     return sum(distance(coords[path[i]], coords[path[(i+1)%len(path)]]) for i in range(len(path)))
 
-def genetic_tsp(coords, pop_size=100, generations=500, mutate_rate=0.01):
-    num_cities = len(coords)
-    def create_ind():
-        return random.sample(range(num_cities), num_cities)
-    def crossover(a, b):
-        start, end = sorted(random.sample(range(num_cities), 2))
-        child = a[start:end] + [c for c in b if c not in a[start:end]]
-        return child
-    def mutate(ind):
-        if random.random() < mutate_rate:
-            i,j = sorted(random.sample(range(num_cities), 2))
-            ind[i],ind[j] = ind[j],ind[i]
-    
-    population = [create_ind() for _ in range(pop_size)]
+def distance_matrix(coords):
+    pts = np.asarray(coords, dtype=float)
+    diff = pts[:, None, :] - pts[None, :, :]
+    return np.hypot(diff[..., 0], diff[..., 1])
+
+def population_lengths(population, dist):
+    # population is a (pop_size x n) int array; one gather over all edges of all tours
+    return dist[population, np.roll(population, -1, axis=1)].sum(axis=1)
+
+def tour_length(tour, dist):
+    return float(dist[tour, np.roll(tour, -1)].sum())
+
+class FitnessCache:
+    # bounded LRU of tour length keyed by the tour's raw bytes
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.hits = 0
+
+    def get(self, key):
+        value = self.entries.get(key)
+        if value is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+def edge_diversity(population, best):
+    # share of edges (either direction) that differ from the best tour's edges, averaged
+    succ = np.empty(len(best), dtype=population.dtype)
+    succ[best] = np.roll(best, -1)
+    nxt = np.roll(population, -1, axis=1)
+    shared = (succ[population] == nxt) | (succ[nxt] == population)
+    return 1.0 - float(shared.mean())
+
+class RunController:
+    # stops a run on a time, evaluation or stagnation budget, and raises the
+    # mutation rate while the population's edge diversity is below a floor
+    def __init__(self, time_limit=None, max_evaluations=None, stagnation=None, min_improvement=1e-9,
+                 diversity_floor=0.05, boost=1.5, max_mutate_rate=0.5):
+        self.time_limit = time_limit
+        self.max_evaluations = max_evaluations
+        self.stagnation = stagnation
+        self.min_improvement = min_improvement
+        self.diversity_floor = diversity_floor
+        self.boost = boost
+        self.max_mutate_rate = max_mutate_rate
+        self.trace = []
+        self.reason = None
+
+    def start(self, mutate_rate):
+        self.started = time.perf_counter()
+        self.base_rate = self.mutate_rate = mutate_rate
+        self.best = float('inf')
+        self.last_improvement = 0
+        self.trace = []
+        self.reason = None
+
+    def update(self, gen, population, lengths, evaluations):
+        best, mean = float(lengths[0]), float(lengths.mean())
+        diversity = edge_diversity(population, population[0])
+        if best < self.best - self.min_improvement:
+            self.best = best
+            self.last_improvement = gen
+        if diversity < self.diversity_floor:
+            self.mutate_rate = min(self.max_mutate_rate, self.mutate_rate * self.boost)
+        else:
+            self.mutate_rate = max(self.base_rate, self.mutate_rate / self.boost)
+        seconds = time.perf_counter() - self.started
+        self.trace.append({"generation": gen, "best": best, "mean": mean, "diversity": diversity,
+                           "mutate_rate": self.mutate_rate, "evaluations": evaluations, "seconds": seconds})
+
+        if self.time_limit is not None and seconds >= self.time_limit:
+            self.reason = "time"
+        elif self.max_evaluations is not None and evaluations >= self.max_evaluations:
+            self.reason = "evaluations"
+        elif self.stagnation is not None and gen - self.last_improvement >= self.stagnation:
+            self.reason = "stagnation"
+        return self.reason is not None
+
+def double_bridge(tour, rng):
+    # A B C D -> A C B D: a segment reordering no sequence of 2-opt moves undoes cheaply
+    n = len(tour)
+    if n < 4:
+        return tour.copy()
+    a, b, c = np.sort(rng.choice(np.arange(1, n), 3, replace=False))
+    return np.concatenate((tour[:a], tour[b:c], tour[a:b], tour[c:]))
+
+def random_population(pop_size, num_cities, rng):
+    return np.argsort(rng.random((pop_size, num_cities)), axis=1)
+
+def evolve(population, dist, generations, mutate_rate, cross, rng, cache=None, stats=None, controller=None):
+    pop_size, num_cities = population.shape
+    cache = cache if cache is not None else FitnessCache(4 * pop_size)
+    hits = cache.hits
+
     best_individual = None
     best_distance = float('inf')
-    
+    half = pop_size // 2
+    # lengths travel with their rows, so survivors are never scored again
+    lengths = population_lengths(population, dist)
+    evaluations = pop_size
+    if controller is not None:
+        controller.start(mutate_rate)
+
     for gen in range(generations):
-        population.sort(key=lambda ind: path_length(ind, coords))
-        current_best = population[0]
-        current_distance = path_length(current_best, coords)
-        
-        if current_distance < best_distance:
-            best_distance = current_distance
-            best_individual = current_best.copy()
-            
-        next_gen = population[:pop_size//2]
-        while len(next_gen) < pop_size:
-            parents = random.sample(next_gen, 2)
-            child = crossover(*parents)
-            mutate(child)
-            next_gen.append(child)
-        population = next_gen
-        
+        order = np.argsort(lengths, kind="stable")
+        population = population[order]
+        lengths = lengths[order]
+
+        if lengths[0] < best_distance:
+            # rescore exactly so patched lengths never drift into the reported result
+            current_distance = tour_length(population[0], dist)
+            if current_distance < best_distance:
+                best_distance = current_distance
+                best_individual = population[0].tolist()
+
+        if controller is not None:
+            if controller.update(gen, population, lengths, evaluations):
+                break
+            mutate_rate = controller.mutate_rate
+
+        unscored = []
+        for k in range(half, pop_size):
+            p1, p2 = rng.choice(k, 2, replace=False)
+            child = cross(population[p1], population[p2], rng)
+            key = child.tobytes()
+            length = cache.get(key)
+            if rng.random() < mutate_rate:
+                # a swap only changes the edges around the two cities, so a known length is patched
+                i, j = rng.choice(num_cities, 2, replace=False)
+                if length is not None:
+                    length += swap_delta(child, dist, i, j)
+                apply_swap(child, i, j)
+                key = child.tobytes()
+                if length is None:
+                    length = cache.get(key)
+                else:
+                    cache.put(key, length)
+            population[k] = child
+            if length is None:
+                unscored.append((k, key))
+            else:
+                lengths[k] = length
+
+        # children that no cache entry covers are scored together in one gather
+        if unscored:
+            rows = [k for k, _ in unscored]
+            lengths[rows] = population_lengths(population[rows], dist)
+            for k, key in unscored:
+                cache.put(key, float(lengths[k]))
+            evaluations += len(unscored)
+
+    if stats is not None:
+        stats["evaluations"] = stats.get("evaluations", 0) + evaluations
+        stats["cache_hits"] = stats.get("cache_hits", 0) + cache.hits - hits
+    return population, best_individual, best_distance
+
+def genetic_tsp(coords, pop_size=100, generations=500, mutate_rate=0.01, seed=None, crossover="segment",
+                seeded_fraction=0.0, construction="nearest", controller=None, dist=None):
+    # dist overrides the Euclidean matrix built from coords, e.g. Loaders.tsplib_matrix
+    # for GEO/ATT/CEIL or EXPLICIT instances; coords may then be None
+    supplied = dist is not None
+    dist = np.asarray(dist, dtype=float) if supplied else distance_matrix(coords)
+    rng = np.random.default_rng(seed)
+    cross = CROSSOVERS[crossover] if isinstance(crossover, str) else crossover
+
+    n = len(dist)
+    population = random_population(pop_size, n, rng)
+    seeds = int(seeded_fraction * pop_size)
+    if seeds and construction != "nearest" and coords is None:
+        raise ValueError(f"Construction {construction!r} needs coordinates")
+    # nearest-neighbour seeds follow a supplied matrix, so they use the search's metric
+    rows = dist.tolist() if seeds and supplied and construction == "nearest" else None
+    base = None
+    for k in range(seeds):
+        if construction == "nearest":
+            start = int(rng.integers(n))
+            if rows is None:
+                population[k] = build_tour(coords, construction, start=start)
+            else:
+                population[k] = nearest_neighbor_matrix_tour(rows, start)
+            continue
+        # the other constructions ignore start, so build once and kick the copies apart
+        if base is None:
+            base = np.asarray(build_tour(coords, construction))
+            population[k] = base
+        else:
+            population[k] = double_bridge(base, rng)
+    _, best_individual, best_distance = evolve(population, dist, generations, mutate_rate, cross, rng,
+                                               controller=controller)
     return best_individual, best_distance
 
+def _island_worker(index, shm_name, shape, seed_seq, params, inbox, outbox, results):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        dist = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+        pop_size, generations, mutate_rate, crossover, interval, migrants = params
+        rng = np.random.default_rng(seed_seq)
+        cross = CROSSOVERS[crossover] if isinstance(crossover, str) else crossover
+
+        population = random_population(pop_size, shape[0], rng)
+        cache = FitnessCache(4 * pop_size)
+        best_individual, best_distance = None, float('inf')
+        history = []
+        done = 0
+        while done < generations:
+            step = min(interval, generations - done)
+            population, ind, d = evolve(population, dist, step, mutate_rate, cross, rng, cache)
+            done += step
+            if d < best_distance:
+                best_individual, best_distance = ind, d
+            history.append(best_distance)
+
+            if outbox is not None and done < generations:
+                # ring migration: send our best to the next island, replace our worst with the previous island's best
+                order = np.argsort(population_lengths(population, dist), kind="stable")
+                outbox.put(population[order[:migrants]])
+                population[order[-migrants:]] = inbox.get()
+
+        lengths = population_lengths(population, dist)
+        stats = {
+            "island": index,
+            "best_distance": best_distance,
+            "final_mean": float(lengths.mean()),
+            "history": history,
+        }
+        results.put((index, best_individual, best_distance, stats))
+    except BaseException:
+        # report instead of dying silently, or the parent and the other islands wait forever
+        results.put((index, None, None, {"island": index, "error": traceback.format_exc()}))
+    finally:
+        shm.close()
+
+def island_genetic_tsp(coords, islands=None, pop_size=100, generations=500, mutate_rate=0.01,
+                       migration_interval=25, migrants=2, seed=None, crossover="segment", dist=None):
+    islands = islands or os.cpu_count() or 1
+    migrants = max(1, min(migrants, pop_size // 2))
+    dist = distance_matrix(coords) if dist is None else np.ascontiguousarray(dist, dtype=np.float64)
+
+    shm = shared_memory.SharedMemory(create=True, size=max(dist.nbytes, 1))
+    workers = []
+    collected = []
+    try:
+        shared = np.ndarray(dist.shape, dtype=np.float64, buffer=shm.buf)
+        shared[:] = dist
+
+        ctx = mp.get_context()
+        queues = [ctx.Queue() for _ in range(islands)]
+        results = ctx.Queue()
+        params = (pop_size, generations, mutate_rate, crossover, migration_interval, migrants)
+        seeds = np.random.SeedSequence(seed).spawn(islands)
+
+        for i in range(islands):
+            inbox = queues[i] if islands > 1 else None
+            outbox = queues[(i + 1) % islands] if islands > 1 else None
+            w = ctx.Process(target=_island_worker,
+                            args=(i, shm.name, dist.shape, seeds[i], params, inbox, outbox, results))
+            w.start()
+            workers.append(w)
+
+        while len(collected) < islands:
+            try:
+                result = results.get(timeout=0.5)
+            except queue.Empty:
+                reported = {r[0] for r in collected}
+                for i, w in enumerate(workers):
+                    if i not in reported and not w.is_alive() and w.exitcode != 0:
+                        raise RuntimeError(f"Island {i} exited with code {w.exitcode}")
+                continue
+            if "error" in result[3]:
+                raise RuntimeError(f"Island {result[0]} failed:\n{result[3]['error']}")
+            collected.append(result)
+        for w in workers:
+            w.join()
+    finally:
+        for w in workers:
+            if w.is_alive():
+                w.terminate()
+                w.join()
+        shm.close()
+        shm.unlink()
+
+    collected.sort(key=lambda r: r[0])
+    _, best_individual, best_distance, _ = min(collected, key=lambda r: r[2])
+    return best_individual, best_distance, [r[3] for r in collected]
+
 def main():
     print("Genetic Algorithm for Traveling Salesman Problem")
     n = int(input("Enter number of cities: "))
@@ -56,9 +322,28 @@ def main():
     pop_size = int(input("Enter population size (default 100): ") or "100")
     generations = int(input("Enter number of generations (default 500): ") or "500")
     mutate_rate = float(input("Enter mutation rate (default 0.01): ") or "0.01")
+    crossover = input("Enter crossover operator (segment/ox/pmx/erx, default segment): ") or "segment"
+    islands = int(input("Enter number of islands (default 1): ") or "1")
+    controller = None
+    if islands <= 1:
+        limit = input("Enter time limit in seconds (blank for none): ")
+        window = input("Stop after how many generations without improvement (blank for never): ")
+        controller = RunController(time_limit=float(limit) if limit else None,
+                                   stagnation=int(window) if window else None)
     
     print("\nRunning genetic algorithm...")
-    best_path, best_distance = genetic_tsp(coords, pop_size, generations, mutate_rate)
+    if islands > 1:
+        best_path, best_distance, island_stats = island_genetic_tsp(
+            coords, islands, pop_size, generations, mutate_rate, crossover=crossover)
+        for st in island_stats:
+            print(f"Island {st['island']}: best = {st['best_distance']:.4f}, final mean = {st['final_mean']:.4f}")
+    else:
+        best_path, best_distance = genetic_tsp(coords, pop_size, generations, mutate_rate, crossover=crossover,
+                                               controller=controller)
+        last = controller.trace[-1] if controller.trace else None
+        if last:
+            print(f"Ran {len(controller.trace)} generations in {last['seconds']:.2f}s",
+                  f"(stopped by {controller.reason or 'generation limit'}), final diversity {last['diversity']:.3f}")
     
     print("\nGenetic Algorithm TSP Result:")
     print("Best Path Found:", " -> ".join(str(city) for city in best_path) + " -> " + str(best_path[0]))
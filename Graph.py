@@ -0,0 +1,135 @@
+import json
+from array import array
+
+class Graph:
+    def __init__(self, names, offsets, targets, weights=None):
+        self.names = names
+        self.index = {name: i for i, name in enumerate(names)}
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_tree(cls, tree):
+        # accepts {node: [child, ...]} as well as {node: [(child, cost), ...]}
+        names = list(tree)
+        index = {name: i for i, name in enumerate(names)}
+        weighted = None
+        for children in tree.values():
+            for child in children:
+                if weighted is None:
+                    weighted = isinstance(child, tuple)
+                name = child[0] if weighted else child
+                if name not in index:
+                    index[name] = len(names)
+                    names.append(name)
+
+        offsets = array('q', [0]) * (len(names) + 1)
+        targets = array('i')
+        weights = array('d') if weighted else None
+        for i, name in enumerate(names):
+            for child in tree.get(name, ()):
+                if weighted:
+                    targets.append(index[child[0]])
+                    weights.append(child[1])
+                else:
+                    targets.append(index[child])
+            offsets[i + 1] = len(targets)
+        return cls(names, offsets, targets, weights)
+
+    @classmethod
+    def from_edges(cls, edges, names=None):
+        # edges: iterable of (u, v) or (u, v, cost) name pairs; order within each u is kept
+        names = list(names or ())
+        index = {name: i for i, name in enumerate(names)}
+        src, dst, cost = array('i'), array('i'), array('d')
+        for edge in edges:
+            for name in edge[:2]:
+                if name not in index:
+                    index[name] = len(names)
+                    names.append(name)
+            src.append(index[edge[0]])
+            dst.append(index[edge[1]])
+            if len(edge) > 2:
+                cost.append(edge[2])
+        return cls.from_arrays(names, src, dst, cost if len(cost) else None)
+
+    @classmethod
+    def from_arrays(cls, names, src, dst, weights=None):
+        # counting sort of the edge list by source node
+        n = len(names)
+        offsets = array('q', [0]) * (n + 1)
+        for u in src:
+            offsets[u + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+        fill = array('q', offsets[:n])
+        targets = array('i', [0]) * len(src)
+        out_weights = array('d', [0.0]) * len(src) if weights is not None else None
+        for e, u in enumerate(src):
+            k = fill[u]
+            fill[u] = k + 1
+            targets[k] = dst[e]
+            if out_weights is not None:
+                out_weights[k] = weights[e]
+        return cls(names, offsets, targets, out_weights)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name in self.index
+
+    def num_edges(self):
+        return len(self.targets)
+
+    def id(self, name):
+        return self.index[name]
+
+    def name(self, i):
+        return self.names[i]
+
+    def neighbors(self, i):
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def edges(self, i):
+        targets, weights = self.targets, self.weights
+        for k in range(self.offsets[i], self.offsets[i + 1]):
+            yield targets[k], weights[k] if weights is not None else 1
+
+    def reverse(self):
+        n = len(self.names)
+        src = array('i')
+        for u in range(n):
+            src.extend([u] * (self.offsets[u + 1] - self.offsets[u]))
+        return Graph.from_arrays(self.names, self.targets, src, self.weights)
+
+    def to_tree(self):
+        tree = {}
+        for u, name in enumerate(self.names):
+            if self.weights is None:
+                tree[name] = [self.names[v] for v in self.neighbors(u)]
+            else:
+                tree[name] = [(self.names[v], c) for v, c in self.edges(u)]
+        return tree
+
+def reverse_tree(tree):
+    # {node: [child]} -> {child: [node]}, and likewise for (child, cost) pairs
+    reverse = {}
+    for node, children in tree.items():
+        for child in children:
+            if isinstance(child, tuple):
+                reverse.setdefault(child[0], []).append((node, child[1]))
+            else:
+                reverse.setdefault(child, []).append(node)
+    return reverse
+
+def encode_names(names):
+    # JSON keeps str, int and float names distinct, so they survive a save/load round trip
+    for name in names:
+        if not isinstance(name, (str, int, float)):
+            raise TypeError(f"Cannot store node name {name!r} of type {type(name).__name__}")
+    return json.dumps(list(names)).encode('utf-8')
+
+def decode_names(blob):
+    return json.loads(blob.decode('utf-8'))
\ No newline at end of file
@@ -1,4 +1,5 @@
 import random
+from Moves_TSP import IMPROVEMENT_EPS, swap_delta, apply_swap, swap_moves, out_of_time
 
 def input_tsp():
     n = int(input("Enter number of cities: "))
@@ -17,33 +18,41 @@ def tour_cost(tour, dist):
         cost += dist[tour[i]][tour[j]]
     return cost
 
-def two_opt_neighbors(tour):
-    neighbors = []
-    n = len(tour)
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            nbr = tour.copy()
-            nbr[i], nbr[j] = nbr[j], nbr[i]
-            neighbors.append(nbr)
-    return neighbors
+def two_opt_neighbors(tour, order="sequential"):
+    for i, j in swap_moves(len(tour), order):
+        nbr = tour.copy()
+        nbr[i], nbr[j] = nbr[j], nbr[i]
+        yield nbr
 
-def simple_hill_climbing(dist, start_tour):
-    current = start_tour
+def simple_hill_climbing(dist, start_tour, order="sequential", stats=None, deadline=None,
+                         max_evaluations=None):
+    current = list(start_tour)
     current_cost = tour_cost(current, dist)
     path = [current_cost]
 
+    n = len(current)
+    last_move = None
+    evaluations = 0
+    limit = float('inf') if max_evaluations is None else max_evaluations
     while True:
         improved = False
-        for nbr in two_opt_neighbors(current):
-            c = tour_cost(nbr, dist)
-            if c < current_cost:
-                current, current_cost = nbr, c
+        for i, j in swap_moves(n, order, start=last_move):
+            if evaluations >= limit or (not evaluations & 1023 and out_of_time(deadline)):
+                break
+            delta = swap_delta(current, dist, i, j)
+            evaluations += 1
+            if delta < -IMPROVEMENT_EPS:
+                apply_swap(current, i, j)
+                current_cost += delta
                 path.append(current_cost)
+                last_move = (i, j)
                 improved = True
                 break
         if not improved:
             break
 
+    if stats is not None:
+        stats["evaluations"] = evaluations
     return current, current_cost, path
 
 if __name__ == "__main__":
@@ -16,39 +16,97 @@ def input_tree_with_heuristics():
     
     return tree, heuristics
 
-def ida_star(start, goal, tree, heuristics):
-    threshold = heuristics[start]
+def ida_star(start, goal, tree, heuristics, on_iteration=None, table_size=100000, stats=None):
+    h = heuristics if callable(heuristics) else heuristics.__getitem__
+    threshold = h(start)
     path = [start]
+    iterations = 0
+    expansions = 0
 
     while True:
-        print(f"\nCurrent Threshold: {threshold}")
-        temp = search(path, 0, threshold, goal, tree, heuristics)
-        print("Path in this iteration:", " -> ".join(path))
-        if temp == "FOUND":
-            return path
-        if temp == float('inf'):
-            return None
+        iterations += 1
+        run = {}
+        table = TranspositionTable(table_size)
+        temp = search(path, 0, threshold, goal, tree, heuristics, table, run)
+        expansions += run["expansions"]
+        if on_iteration is not None:
+            on_iteration(threshold, list(path))
+        if temp == "FOUND" or temp == float('inf'):
+            if stats is not None:
+                stats.update(iterations=iterations, expansions=expansions)
+            return path if temp == "FOUND" else None
         threshold = temp
 
-def search(path, g, threshold, goal, tree, heuristics):
-    current = path[-1]
-    f = g + heuristics[current]
+class TranspositionTable:
+    # best g at which each state was entered during one threshold iteration;
+    # once full, the oldest entries are dropped first
+    def __init__(self, size):
+        self.size = size
+        self.best = {}
+
+    def prune(self, state, g):
+        best = self.best.get(state)
+        if best is not None and best <= g:
+            return True
+        if best is None and len(self.best) >= self.size:
+            if self.size <= 0:
+                return False
+            del self.best[next(iter(self.best))]
+        self.best[state] = g
+        return False
 
+def search(path, g, threshold, goal, tree, heuristics, table=None, stats=None):
+    # explicit-stack DFS bounded by f <= threshold; path is extended in place on success
+    successors = tree if callable(tree) else (lambda node: tree.get(node, []))
+    h = heuristics if callable(heuristics) else heuristics.__getitem__
+    is_goal = goal if callable(goal) else (lambda node: node == goal)
+
+    if stats is not None:
+        stats["expansions"] = 0
+    root = path[-1]
+    f = g + h(root)
     if f > threshold:
         return f
-    if current == goal:
+    if is_goal(root):
         return "FOUND"
 
+    depth = len(path)
+    on_path = set(path)
+    g_stack = [g]
+    frames = [iter(successors(root))]
     min_threshold = float('inf')
-    for neighbor, cost in tree.get(current, []):
-        if neighbor not in path:
+    expansions = 1
+
+    while frames:
+        for neighbor, cost in frames[-1]:
+            if neighbor in on_path:
+                continue
+            child_g = g_stack[-1] + cost
+            f = child_g + h(neighbor)
+            if f > threshold:
+                if f < min_threshold:
+                    min_threshold = f
+                continue
+            if table is not None and table.prune(neighbor, child_g):
+                continue
             path.append(neighbor)
-            temp = search(path, g + cost, threshold, goal, tree, heuristics)
-            if temp == "FOUND":
+            if is_goal(neighbor):
+                if stats is not None:
+                    stats["expansions"] = expansions
                 return "FOUND"
-            if temp < min_threshold:
-                min_threshold = temp
-            path.pop()
+            on_path.add(neighbor)
+            g_stack.append(child_g)
+            frames.append(iter(successors(neighbor)))
+            expansions += 1
+            break
+        else:
+            frames.pop()
+            g_stack.pop()
+            if len(path) > depth:
+                on_path.discard(path.pop())
+
+    if stats is not None:
+        stats["expansions"] = expansions
     return min_threshold
 
 if __name__ == "__main__":
@@ -56,7 +114,11 @@ if __name__ == "__main__":
     start = input("\nEnter start node: ")
     goal = input("Enter goal node: ")
 
-    result_path = ida_star(start, goal, tree, heuristics)
+    def report(threshold, path):
+        print(f"\nCurrent Threshold: {threshold}")
+        print("Path in this iteration:", " -> ".join(path))
+
+    result_path = ida_star(start, goal, tree, heuristics, on_iteration=report)
 
     if result_path:
         print("\nFinal path found:", " -> ".join(result_path))
@@ -1,23 +1,86 @@
-def dls(tree, node, goal, depth, visited):
-    if node == goal:
-        return [node]
-    if depth == 0:
-        return []
-    
-    for neighbor in tree.get(node, []):
-        if neighbor not in visited:
-            visited.add(neighbor)
-            res = dls(tree, neighbor, goal, depth-1, visited)
-            if res:
-                return [node] + res
-    return []
-
-def iddfs(tree, start, goal, max_depth):
+from Graph import Graph
+
+def dls(successors, start, goal, limit, best_depth):
+    # explicit-stack depth-limited search; best_depth keeps the shallowest depth each
+    # node was entered at, so a node is only re-expanded when reached by a shorter path
+    if start == goal:
+        return [start], False
+    best_depth[start] = 0
+    path = [start]
+    frames = [iter(successors(start))] if limit > 0 else []
+    cutoff = limit == 0 and has_successors(successors, start)
+
+    while frames:
+        depth = len(path)
+        for neighbor in frames[-1]:
+            if best_depth.get(neighbor, depth + 1) <= depth:
+                continue
+            best_depth[neighbor] = depth
+            if neighbor == goal:
+                path.append(neighbor)
+                return path, cutoff
+            if depth == limit:
+                if not cutoff and has_successors(successors, neighbor):
+                    cutoff = True
+                continue
+            path.append(neighbor)
+            frames.append(iter(successors(neighbor)))
+            break
+        else:
+            frames.pop()
+            path.pop()
+    return None, cutoff
+
+def has_successors(successors, node):
+    for _ in successors(node):
+        return True
+    return False
+
+def frontier_search(successors, start, goal, max_depth):
+    # reuses each level's frontier instead of replaying the shallower levels
+    if start == goal:
+        return [start], 0
+    parent = {start: None}
+    frontier = [start]
+    for depth in range(1, max_depth + 1):
+        next_frontier = []
+        for node in frontier:
+            for neighbor in successors(node):
+                if neighbor in parent:
+                    continue
+                parent[neighbor] = node
+                if neighbor == goal:
+                    path = [neighbor]
+                    while parent[path[-1]] is not None:
+                        path.append(parent[path[-1]])
+                    return path[::-1], depth
+                next_frontier.append(neighbor)
+        if not next_frontier:
+            break
+        frontier = next_frontier
+    return [], -1
+
+def iddfs(tree, start, goal, max_depth, reuse_frontier=False, stats=None):
+    if isinstance(tree, Graph):
+        if start not in tree:
+            return ([start], 0) if start == goal else ([], -1)
+        ids = iddfs(tree.neighbors, tree.id(start), tree.index.get(goal, -1), max_depth,
+                    reuse_frontier, stats)
+        return [tree.names[i] for i in ids[0]], ids[1]
+
+    successors = tree if callable(tree) else (lambda node: tree.get(node, []))
+    if reuse_frontier:
+        return frontier_search(successors, start, goal, max_depth)
+
     for depth in range(max_depth+1):
-        visited = set([start])
-        path = dls(tree, start, goal, depth, visited)
+        path, cutoff = dls(successors, start, goal, depth, {})
+        if stats is not None:
+            stats["iterations"] = depth + 1
         if path:
             return path, depth
+        if not cutoff:
+            # nothing was left unexplored at this limit, so deeper limits cannot help
+            break
     return [], -1
 
 def main():
@@ -0,0 +1,94 @@
+class IndexedHeap:
+    # binary min-heap of (priority, item) that knows where every item sits,
+    # so an item's priority can be lowered in place instead of pushed twice
+    def __init__(self):
+        self.heap = []
+        self.pos = {}
+
+    def __len__(self):
+        return len(self.heap)
+
+    def __bool__(self):
+        return bool(self.heap)
+
+    def __contains__(self, item):
+        return item in self.pos
+
+    def priority(self, item):
+        return self.heap[self.pos[item]][0]
+
+    def push(self, item, priority):
+        self.heap.append((priority, item))
+        self.pos[item] = len(self.heap) - 1
+        self._sift_up(len(self.heap) - 1)
+
+    def decrease_key(self, item, priority):
+        i = self.pos[item]
+        if priority < self.heap[i][0]:
+            self.heap[i] = (priority, item)
+            self._sift_up(i)
+
+    def push_or_decrease(self, item, priority):
+        if item in self.pos:
+            self.decrease_key(item, priority)
+            return False
+        self.push(item, priority)
+        return True
+
+    def peek(self):
+        priority, item = self.heap[0]
+        return item, priority
+
+    def pop(self):
+        heap = self.heap
+        priority, item = heap[0]
+        last = heap.pop()
+        del self.pos[item]
+        if heap:
+            heap[0] = last
+            self.pos[last[1]] = 0
+            self._sift_down(0)
+        return item, priority
+
+    def remove(self, item):
+        i = self.pos.pop(item)
+        heap = self.heap
+        last = heap.pop()
+        if i < len(heap):
+            heap[i] = last
+            self.pos[last[1]] = i
+            self._sift_up(i)
+            self._sift_down(self.pos[last[1]])
+
+    def _sift_up(self, i):
+        heap, pos = self.heap, self.pos
+        entry = heap[i]
+        while i > 0:
+            parent = (i - 1) >> 1
+            if entry[0] < heap[parent][0]:
+                heap[i] = heap[parent]
+                pos[heap[i][1]] = i
+                i = parent
+            else:
+                break
+        heap[i] = entry
+        pos[entry[1]] = i
+
+    def _sift_down(self, i):
+        heap, pos = self.heap, self.pos
+        n = len(heap)
+        entry = heap[i]
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                break
+            if child + 1 < n and heap[child + 1][0] < heap[child][0]:
+                child += 1
+            if heap[child][0] < entry[0]:
+                heap[i] = heap[child]
+                pos[heap[i][1]] = i
+                i = child
+            else:
+                break
+        heap[i] = entry
+        pos[entry[1]] = i
\ No newline at end of file
@@ -0,0 +1,128 @@
+import heapq
+import random
+import struct
+from array import array
+from Graph import Graph
+
+INF = float('inf')
+MAGIC = b'ALT1'
+
+def dijkstra(graph, source):
+    offsets, targets, weights = graph.offsets, graph.targets, graph.weights
+    dist = array('d', [INF]) * len(graph)
+    dist[source] = 0
+    heap = [(0, source)]
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            nd = d + (weights[k] if weights is not None else 1)
+            if nd < dist[v]:
+                dist[v] = nd
+                heapq.heappush(heap, (nd, v))
+    return dist
+
+class Landmarks:
+    def __init__(self, graph, landmarks, dist_from, dist_to):
+        self.graph = graph
+        self.landmarks = landmarks
+        # row-major K x V tables: dist_from[i*V + v] = d(L_i, v), dist_to[i*V + v] = d(v, L_i)
+        self.dist_from = dist_from
+        self.dist_to = dist_to
+
+    @classmethod
+    def build(cls, tree, k=8, seed=None):
+        graph = tree if isinstance(tree, Graph) else Graph.from_tree(tree)
+        reverse = graph.reverse()
+        n = len(graph)
+        rng = random.Random(seed)
+        landmarks = array('i')
+        dist_from, dist_to = array('d'), array('d')
+        if n == 0:
+            return cls(graph, landmarks, dist_from, dist_to)
+
+        # farthest-point selection: start from the node farthest from a random seed,
+        # then keep adding the node farthest from every landmark chosen so far
+        seed_dist = dijkstra(graph, rng.randrange(n))
+        candidate = max((v for v in range(n) if seed_dist[v] < INF), key=seed_dist.__getitem__)
+        coverage = [INF] * n
+        for _ in range(min(k, n)):
+            landmarks.append(candidate)
+            fwd, bwd = dijkstra(graph, candidate), dijkstra(reverse, candidate)
+            dist_from.extend(fwd)
+            dist_to.extend(bwd)
+            for v in range(n):
+                score = min(fwd[v], bwd[v])
+                if score < coverage[v]:
+                    coverage[v] = score
+            chosen = set(landmarks)
+            candidate = max((v for v in range(n) if v not in chosen), key=coverage.__getitem__, default=None)
+            if candidate is None:
+                break
+        return cls(graph, landmarks, dist_from, dist_to)
+
+    def estimate(self, v, t):
+        n = len(self.graph)
+        dist_from, dist_to = self.dist_from, self.dist_to
+        best = 0
+        for i in range(len(self.landmarks)):
+            base = i * n
+            # triangle inequality, both directions: d(v,t) >= d(L,t) - d(L,v) and d(v,t) >= d(v,L) - d(t,L)
+            lv, lt = dist_from[base + v], dist_from[base + t]
+            if lv < INF and lt < INF and lt - lv > best:
+                best = lt - lv
+            vl, tl = dist_to[base + v], dist_to[base + t]
+            if vl < INF and tl < INF and vl - tl > best:
+                best = vl - tl
+        return best
+
+    def heuristic(self, a, b):
+        index = self.graph.index
+        if a not in index or b not in index:
+            return 0
+        return self.estimate(index[a], index[b])
+
+    def for_goal(self, goal):
+        return GoalHeuristics(self, goal)
+
+    def save(self, path):
+        with open(path, 'wb') as f:
+            f.write(MAGIC)
+            f.write(struct.pack('<qqq', len(self.graph), self.graph.num_edges(), len(self.landmarks)))
+            self.landmarks.tofile(f)
+            self.dist_from.tofile(f)
+            self.dist_to.tofile(f)
+
+    @classmethod
+    def load(cls, path, tree):
+        graph = tree if isinstance(tree, Graph) else Graph.from_tree(tree)
+        with open(path, 'rb') as f:
+            if f.read(4) != MAGIC:
+                raise ValueError(f"{path} is not a landmark file")
+            n, m, k = struct.unpack('<qqq', f.read(24))
+            if n != len(graph) or m != graph.num_edges():
+                raise ValueError("Landmark file was built for a different graph")
+            landmarks, dist_from, dist_to = array('i'), array('d'), array('d')
+            landmarks.fromfile(f, k)
+            dist_from.fromfile(f, k * n)
+            dist_to.fromfile(f, k * n)
+        return cls(graph, landmarks, dist_from, dist_to)
+
+class GoalHeuristics:
+    # dict-like view of the landmark bound towards one goal, usable wherever
+    # a {node: heuristic} mapping is expected (A_Star_Heuristic.a_star)
+    def __init__(self, landmarks, goal):
+        self.landmarks = landmarks
+        self.index = landmarks.graph.index
+        self.goal = self.index.get(goal)
+
+    def __getitem__(self, node):
+        v = self.index.get(node)
+        if v is None or self.goal is None:
+            return 0
+        return self.landmarks.estimate(v, self.goal)
+
+    def __contains__(self, node):
+        return True
\ No newline at end of file
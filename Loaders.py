@@ -0,0 +1,292 @@
+import math
+import struct
+from array import array
+import numpy as np
+from Graph import Graph, encode_names, decode_names
+
+MAGIC = b'GRF2'
+GEO_RADIUS = 6378.388
+# TSPLIB column-wise formats list the same numbers as the mirrored row-wise ones
+FORMAT_ALIASES = {
+    "UPPER_COL": "LOWER_ROW",
+    "LOWER_COL": "UPPER_ROW",
+    "UPPER_DIAG_COL": "LOWER_DIAG_ROW",
+    "LOWER_DIAG_COL": "UPPER_DIAG_ROW",
+}
+
+class NumberStream:
+    # hands out numbers from a line iterator in any chunk size, since TSPLIB
+    # lines need not line up with matrix rows
+    def __init__(self, lines):
+        self.lines = lines
+        self.buffer = np.zeros(0)
+
+    def take(self, count):
+        out = np.empty(count)
+        filled = 0
+        while filled < count:
+            if not len(self.buffer):
+                line = next(self.lines, None)
+                if line is None:
+                    raise ValueError("File ended inside a data section")
+                self.buffer = np.array(line.split(), dtype=float)
+                continue
+            step = min(count - filled, len(self.buffer))
+            out[filled:filled + step] = self.buffer[:step]
+            self.buffer = self.buffer[step:]
+            filled += step
+        return out
+
+def _number(token):
+    try:
+        return int(token)
+    except ValueError:
+        return float(token)
+
+def _matrix(n, path=None):
+    # plain array, or a .npy file mapped into memory when a path is given
+    if path is None:
+        return np.empty((n, n))
+    return np.lib.format.open_memmap(path, mode='w+', dtype=np.float64, shape=(n, n))
+
+def _read_weights(stream, n, fmt, out):
+    fmt = FORMAT_ALIASES.get(fmt, fmt)
+    for i in range(n):
+        if fmt == "FULL_MATRIX":
+            out[i] = stream.take(n)
+        elif fmt == "UPPER_ROW":
+            row = stream.take(n - i - 1)
+            out[i, i] = 0
+            out[i, i + 1:] = row
+            out[i + 1:, i] = row
+        elif fmt == "UPPER_DIAG_ROW":
+            row = stream.take(n - i)
+            out[i, i:] = row
+            out[i:, i] = row
+        elif fmt == "LOWER_ROW":
+            row = stream.take(i)
+            out[i, i] = 0
+            out[i, :i] = row
+            out[:i, i] = row
+        elif fmt == "LOWER_DIAG_ROW":
+            row = stream.take(i + 1)
+            out[i, :i + 1] = row
+            out[:i + 1, i] = row
+        else:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_FORMAT {fmt}")
+    return out
+
+def _read_coords(lines, n, width):
+    # one "id x y [z]" node per line; ids must cover 1..n exactly once
+    coords = np.empty((n, width - 1))
+    seen = bytearray(n)
+    filled = 0
+    while filled < n:
+        line = next(lines, None)
+        if line is None:
+            raise ValueError("File ended inside a coordinate section")
+        parts = line.split()
+        if not parts:
+            continue
+        if len(parts) != width:
+            raise ValueError(f"Expected {width} fields per coordinate line, got {line.strip()!r}")
+        node = int(parts[0])
+        if not 1 <= node <= n or seen[node - 1]:
+            raise ValueError(f"Node id {node} is out of range or repeated")
+        seen[node - 1] = 1
+        coords[node - 1] = [float(p) for p in parts[1:]]
+        filled += 1
+    return coords
+
+def read_tsplib(path, matrix_path=None):
+    # returns a dict with the header fields plus "coords" (n x 2 or n x 3) and,
+    # for EXPLICIT instances, "dist" (n x n), memory-mapped to matrix_path if given
+    instance = {"coords": None, "dist": None}
+    with open(path) as f:
+        lines = iter(f)
+        stream = NumberStream(lines)
+        for line in lines:
+            line = line.strip()
+            if not line:
+                continue
+            if line == "EOF":
+                break
+            if ":" in line:
+                key, value = line.split(":", 1)
+                key, value = key.strip().upper(), value.strip()
+                instance[key.lower()] = int(value) if key in ("DIMENSION", "CAPACITY") else value
+                continue
+
+            section = line.upper()
+            n = instance.get("dimension")
+            if n is None:
+                raise ValueError(f"{section} appears before DIMENSION")
+            if len(stream.buffer):
+                raise ValueError(f"Unexpected numbers before {section}")
+            if section in ("NODE_COORD_SECTION", "DISPLAY_DATA_SECTION"):
+                three_d = "3D" in instance.get("edge_weight_type", "") or \
+                          instance.get("node_coord_type", "").upper() == "THREED_COORDS"
+                width = 4 if three_d and section == "NODE_COORD_SECTION" else 3
+                coords = _read_coords(lines, n, width)
+                if section == "NODE_COORD_SECTION" or instance["coords"] is None:
+                    instance["coords"] = coords
+            elif section == "EDGE_WEIGHT_SECTION":
+                fmt = instance.get("edge_weight_format", "FULL_MATRIX").upper()
+                instance["dist"] = _read_weights(stream, n, fmt, _matrix(n, matrix_path))
+                if len(stream.buffer):
+                    raise ValueError("EDGE_WEIGHT_SECTION holds more numbers than its format allows")
+            elif section in ("TOUR_SECTION", "FIXED_EDGES_SECTION", "DEPOT_SECTION"):
+                # -1 terminated lists we do not use
+                while stream.take(1)[0] != -1:
+                    pass
+            else:
+                raise ValueError(f"Unsupported TSPLIB section {section}")
+    return instance
+
+def _nint(x):
+    return np.floor(x + 0.5)
+
+def geo_radians(coords):
+    # TSPLIB GEO: DDD.MM degrees and minutes, with the degrees truncated toward zero
+    degrees = np.trunc(coords)
+    return math.pi * (degrees + 5.0 * (coords - degrees) / 3.0) / 180.0
+
+def tsplib_matrix(instance, path=None, block=1024):
+    # distance matrix for a parsed instance, using TSPLIB's rounding rules;
+    # built a block of rows at a time so only the output is ever n x n.
+    # "UNROUNDED" is not a TSPLIB type: plain Euclidean distances, no rounding
+    if instance["dist"] is not None:
+        return instance["dist"]
+    kind = instance.get("edge_weight_type", "EUC_2D").upper()
+    coords = instance["coords"]
+    if kind == "GEO":
+        coords = geo_radians(coords)
+    n = len(coords)
+    out = _matrix(n, path)
+    for lo in range(0, n, block):
+        diff = coords[lo:lo + block, None, :] - coords[None, :, :]
+        if kind in ("EUC_2D", "EUC_3D"):
+            rows = _nint(np.sqrt((diff * diff).sum(axis=2)))
+        elif kind in ("CEIL_2D", "CEIL_3D"):
+            rows = np.ceil(np.sqrt((diff * diff).sum(axis=2)))
+        elif kind in ("MAN_2D", "MAN_3D"):
+            rows = _nint(np.abs(diff).sum(axis=2))
+        elif kind in ("MAX_2D", "MAX_3D"):
+            rows = _nint(np.abs(diff)).max(axis=2)
+        elif kind == "ATT":
+            r = np.sqrt((diff * diff).sum(axis=2) / 10.0)
+            t = _nint(r)
+            rows = np.where(t < r, t + 1, t)
+        elif kind == "GEO":
+            lat, lon = coords[lo:lo + block, None, 0], coords[lo:lo + block, None, 1]
+            q1 = np.cos(lon - coords[None, :, 1])
+            q2 = np.cos(lat - coords[None, :, 0])
+            q3 = np.cos(lat + coords[None, :, 0])
+            arc = np.arccos(np.clip(0.5 * ((1.0 + q1) * q2 - (1.0 - q1) * q3), -1.0, 1.0))
+            rows = np.trunc(GEO_RADIUS * arc + 1.0)
+            rows[np.arange(len(rows)), np.arange(lo, lo + len(rows))] = 0
+        elif kind == "UNROUNDED":
+            rows = np.sqrt((diff * diff).sum(axis=2))
+        else:
+            raise ValueError(f"Unsupported EDGE_WEIGHT_TYPE {kind}")
+        out[lo:lo + block] = rows
+    return out
+
+def save_array(path, values):
+    np.save(path, np.asarray(values))
+
+def load_array(path, mmap=True):
+    # .npy distance matrices and coordinates open as read-only memory maps. The
+    # NumPy solvers (GeneticTSP) take these as they are; the pure-Python climbers
+    # index dist[a][b] per move, which is many times slower on NumPy scalars, so
+    # give them matrix_rows() instead
+    return np.load(path, mmap_mode='r' if mmap else None)
+
+def matrix_rows(matrix):
+    # one zero-copy float memoryview per row, as MultiStart_TSP's workers use,
+    # so dist[a][b] is a plain Python float lookup
+    values = np.ascontiguousarray(matrix, dtype=np.float64)
+    n = len(values)
+    flat = memoryview(values.reshape(-1)).cast('B').cast('d')
+    return [flat[i * n:(i + 1) * n] for i in range(n)]
+
+def load_rows(path):
+    return matrix_rows(load_array(path))
+
+def iter_edge_list(path):
+    # "u v" or "u v cost" per line, the same form on every line; blank lines
+    # and # or % comments are skipped
+    width = None
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            parts = line.split()
+            if not parts or parts[0][0] in "#%":
+                continue
+            if width is None and len(parts) in (2, 3):
+                width = len(parts)
+            if len(parts) != width:
+                raise ValueError(f"{path}:{number}: expected {width or '2 or 3'} fields per edge, "
+                                 f"got {line.strip()!r}")
+            if width == 3:
+                yield parts[0], parts[1], _number(parts[2])
+            else:
+                yield parts[0], parts[1]
+
+def read_edge_list(path, undirected=False):
+    edges = iter_edge_list(path)
+    if undirected:
+        edges = (e for edge in edges for e in (edge, (edge[1], edge[0]) + tuple(edge[2:])))
+    return Graph.from_edges(edges)
+
+def read_heuristics(path):
+    # "node value" per line, as A_Star_Heuristic and IDA_star expect
+    heuristics = {}
+    with open(path) as f:
+        for line in f:
+            parts = line.split()
+            if parts and parts[0][0] not in "#%":
+                heuristics[parts[0]] = _number(parts[1])
+    return heuristics
+
+def save_graph(path, graph):
+    blob = encode_names(graph.names)
+    weighted = graph.weights is not None
+    with open(path, 'wb') as f:
+        f.write(MAGIC)
+        f.write(struct.pack('<qqqq', len(graph), graph.num_edges(), int(weighted), len(blob)))
+        f.write(blob)
+        graph.offsets.tofile(f)
+        graph.targets.tofile(f)
+        if weighted:
+            graph.weights.tofile(f)
+
+def load_graph(path):
+    with open(path, 'rb') as f:
+        if f.read(4) != MAGIC:
+            raise ValueError(f"{path} is not a graph file")
+        n, m, weighted, blob_len = struct.unpack('<qqqq', f.read(32))
+        names = decode_names(f.read(blob_len))
+        offsets, targets = array('q'), array('i')
+        offsets.fromfile(f, n + 1)
+        targets.fromfile(f, m)
+        weights = None
+        if weighted:
+            weights = array('d')
+            weights.fromfile(f, m)
+    return Graph(names, offsets, targets, weights)
+
+if __name__ == "__main__":
+    path = input("Enter a .tsp file or an edge list: ")
+    if path.endswith(".tsp"):
+        instance = read_tsplib(path)
+        dist = tsplib_matrix(instance)
+        print(f"{instance.get('name', path)}: {len(dist)} cities, {instance.get('edge_weight_type')}")
+        out = input("Save the distance matrix as .npy (blank to skip): ")
+        if out:
+            save_array(out, dist)
+    else:
+        graph = read_edge_list(path)
+        print(f"{len(graph)} nodes, {graph.num_edges()} edges")
+        out = input("Save as a binary graph file (blank to skip): ")
+        if out:
+            save_graph(out, graph)
\ No newline at end of file
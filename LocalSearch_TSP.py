@@ -0,0 +1,161 @@
+import heapq
+import random
+from collections import deque
+from HillClimbing_TSP import input_tsp, tour_cost
+from Moves_TSP import IMPROVEMENT_EPS, out_of_time
+
+# 2-opt and Or-opt both reverse tour segments, so dist is assumed symmetric.
+
+def nearest_neighbors(dist, k=8):
+    n = len(dist)
+    k = min(k, n - 1)
+    neighbors = []
+    for i in range(n):
+        row = dist[i]
+        neighbors.append(heapq.nsmallest(k, (j for j in range(n) if j != i), key=row.__getitem__))
+    return neighbors
+
+class TourArray:
+    def __init__(self, tour):
+        self.tour = list(tour)
+        self.n = len(self.tour)
+        self.pos = [0] * self.n
+        for i, city in enumerate(self.tour):
+            self.pos[city] = i
+
+    def succ(self, city):
+        return self.tour[(self.pos[city] + 1) % self.n]
+
+    def pred(self, city):
+        return self.tour[self.pos[city] - 1]
+
+    def reverse(self, first, last):
+        # reverse the path first..last, or its complement if that is shorter
+        tour, pos, n = self.tour, self.pos, self.n
+        i, j = pos[first], pos[last]
+        length = (j - i) % n + 1
+        if 2 * length > n:
+            i, j = (j + 1) % n, (i - 1) % n
+            length = n - length
+        for _ in range(length // 2):
+            a, b = tour[i], tour[j]
+            tour[i], tour[j] = b, a
+            pos[a], pos[b] = j, i
+            i = (i + 1) % n
+            j = (j - 1) % n
+
+    def two_opt_move(self, t1, t2, t3, t4):
+        # replace edges (t1, t2) and (t3, t4) with (t1, t3) and (t2, t4)
+        if self.succ(t1) == t2:
+            self.reverse(t2, t3)
+        else:
+            self.reverse(t1, t4)
+
+def local_search(dist, start_tour, k=8, neighbors=None, or_opt=True, max_segment=3, stats=None, deadline=None,
+                 max_evaluations=None):
+    n = len(start_tour)
+    if n < 5:
+        return list(start_tour), tour_cost(start_tour, dist)
+    if neighbors is None:
+        neighbors = nearest_neighbors(dist, k)
+
+    t = TourArray(start_tour)
+    queue = deque(t.tour)
+    active = [True] * n
+    evaluations = 0
+
+    def wake(*cities):
+        for city in cities:
+            if not active[city]:
+                active[city] = True
+                queue.append(city)
+
+    def try_two_opt(a):
+        nonlocal evaluations
+        for forward in (True, False):
+            b = t.succ(a) if forward else t.pred(a)
+            d_ab = dist[a][b]
+            for c in neighbors[a]:
+                if d_ab - dist[a][c] <= IMPROVEMENT_EPS:
+                    break
+                d = t.succ(c) if forward else t.pred(c)
+                if c == b or d == a:
+                    continue
+                delta = dist[a][c] + dist[b][d] - d_ab - dist[c][d]
+                evaluations += 1
+                if delta < -IMPROVEMENT_EPS:
+                    if forward:
+                        t.two_opt_move(a, b, c, d)
+                    else:
+                        t.two_opt_move(b, a, d, c)
+                    wake(a, b, c, d)
+                    return True
+        return False
+
+    def try_or_opt(s):
+        nonlocal evaluations
+        e = s
+        segment = {s}
+        for _ in range(max_segment):
+            p, nx = t.pred(s), t.succ(e)
+            if nx == p or len(segment) > n - 3:
+                return False
+            removal_gain = dist[p][s] + dist[e][nx] - dist[p][nx]
+            if removal_gain > IMPROVEMENT_EPS:
+                for end in (s, e):
+                    for c in neighbors[end]:
+                        if dist[end][c] >= removal_gain:
+                            break
+                        if c in segment:
+                            continue
+                        for u in (c, t.pred(c)):
+                            v = t.succ(u)
+                            if u == p or u in segment or v in segment:
+                                continue
+                            keep = dist[u][s] + dist[e][v]
+                            flip = dist[u][e] + dist[s][v]
+                            delta = min(keep, flip) - dist[u][v] - removal_gain
+                            evaluations += 1
+                            if delta < -IMPROVEMENT_EPS:
+                                move_segment(p, s, e, nx, u, v, keep <= flip)
+                                wake(p, s, e, nx, u, v)
+                                return True
+            e = nx
+            segment.add(e)
+        return False
+
+    def move_segment(p, s, e, nx, u, v, keep_orientation):
+        # p s..e nx ... u v  ->  p nx ... u e..s v, as a chain of 2-opt moves
+        if v != p:
+            t.two_opt_move(p, s, u, v)
+            if u != nx:
+                t.two_opt_move(p, u, nx, e)
+        else:
+            t.two_opt_move(u, p, e, nx)
+        if keep_orientation:
+            t.two_opt_move(u, e, s, v)
+
+    limit = float('inf') if max_evaluations is None else max_evaluations
+    popped = 0
+    while queue:
+        popped += 1
+        if evaluations >= limit or (not popped & 63 and out_of_time(deadline)):
+            break
+        a = queue.popleft()
+        active[a] = False
+        if try_two_opt(a) or (or_opt and try_or_opt(a)):
+            wake(a)
+
+    if stats is not None:
+        stats["evaluations"] = evaluations
+    return t.tour, tour_cost(t.tour, dist)
+
+if __name__ == "__main__":
+    dist = input_tsp()
+    n = len(dist)
+    start = list(range(n))
+    random.shuffle(start)
+    print("\nInitial random tour:", start, "cost =", tour_cost(start, dist))
+    k = int(input("Enter candidate list size k (default 8): ") or "8")
+    tour, cost = local_search(dist, start, k)
+    print("\n2-opt / Or-opt local search → tour:", tour, "\ncost =", cost)
\ No newline at end of file
@@ -1,3 +1,12 @@
+import os
+import random
+import time
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+INF = float('inf')
+EXACT, LOWER, UPPER = 0, 1, 2
+
 def minimax(node, is_maximizing, tree, values):
     if node not in tree:
         return values[node]
@@ -13,22 +22,331 @@ def minimax(node, is_maximizing, tree, values):
         for child in tree[node]:
             best = min(best, minimax(child, True, tree, values))
         return best
-    
-n = int(input("Enter the number of edges in the tree: "))
-tree = {}
-print("Enter the edges (parent child) one per line :")
-
-for _ in range (n):
-    u, v = input().split()
-    tree.setdefault(u, []).append(v)
-
-leaf_count = int(input("Enter the number of leaf nodes: "))
-values = {}
-print("Enter leaf node values one per line: ")
-for _ in range (leaf_count):
-    node, val = input(). split()
-    values[node] = int(val)
-
-root = input("Enter the root node: ")
-result = minimax(root, True, tree, values)
-print("Optimal value: ", result)
\ No newline at end of file
+
+class TranspositionTable:
+    # fixed number of slots indexed by a Zobrist-style 64-bit key; a slot is
+    # overwritten when empty, holding the same position, or backed by a shallower
+    # or smaller search
+    def __init__(self, size=1 << 16, seed=0):
+        self.size = 1 << max(0, (size - 1).bit_length())
+        self.mask = self.size - 1
+        self.slots = [None] * self.size
+        self.rng = random.Random(seed)
+        self.node_keys = {}
+        self.side_key = self.rng.getrandbits(64)
+        self.hits = 0
+
+    def key(self, node, is_maximizing):
+        k = self.node_keys.get(node)
+        if k is None:
+            k = self.node_keys[node] = self.rng.getrandbits(64)
+        return k ^ self.side_key if is_maximizing else k
+
+    def probe(self, key):
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, effort, value, flag, best_child):
+        i = key & self.mask
+        old = self.slots[i]
+        if old is None or old[0] == key or (depth, effort) >= (old[1], old[2]):
+            self.slots[i] = (key, depth, effort, value, flag, best_child)
+
+class MoveOrdering:
+    def __init__(self, scheme="history"):
+        self.scheme = scheme
+        self.killers = {}
+        self.history = {}
+
+    def order(self, children, ply, tt_move=None):
+        if self.scheme == "killer":
+            first = [c for c in self.killers.get(ply, ()) if c in children]
+            rest = [c for c in children if c not in first]
+            ordered = first + rest
+        elif self.scheme == "history":
+            ordered = sorted(children, key=lambda c: -self.history.get(c, 0))
+        else:
+            ordered = list(children)
+        if tt_move is not None and tt_move in ordered:
+            ordered.remove(tt_move)
+            ordered.insert(0, tt_move)
+        return ordered
+
+    def cutoff(self, child, ply, effort):
+        killers = self.killers.setdefault(ply, [])
+        if child not in killers:
+            killers.insert(0, child)
+            del killers[2:]
+        self.history[child] = self.history.get(child, 0) + effort
+
+class SearchTimeout(Exception):
+    pass
+
+class MinimaxEngine:
+    # alpha-beta over an explicit game tree; keeps its table and move-ordering
+    # statistics between calls so repeated move requests reuse earlier work
+    def __init__(self, tree, values, evaluate=None, ordering="history", table_size=1 << 16):
+        self.tree = tree
+        self.values = values
+        self.evaluate = evaluate or (lambda node: 0)
+        self.table = TranspositionTable(table_size)
+        self.moves = MoveOrdering(ordering)
+        self.nodes = 0
+        self.cutoffs = 0
+        self.deadline = None
+
+    def _search(self, node, depth, alpha, beta, is_maximizing, ply):
+        # returns (value, line, complete); complete means no node was cut off by depth
+        self.nodes += 1
+        searched = self.nodes
+        if self.deadline is not None and not searched & 1023 and time.perf_counter() >= self.deadline:
+            raise SearchTimeout
+        if node not in self.tree:
+            return self.values[node], [node], True
+        if depth <= 0:
+            return self.evaluate(node), [node], False
+
+        table = self.table
+        key = table.key(node, is_maximizing)
+        entry = table.probe(key)
+        tt_move = None
+        complete = True
+        if entry is not None:
+            _, stored_depth, _, value, flag, tt_move = entry
+            if stored_depth >= depth:
+                exact = stored_depth == INF
+                if flag == EXACT:
+                    return value, [node] + self.principal_line(tt_move, not is_maximizing), exact
+                if flag == LOWER and value > alpha:
+                    alpha, complete = value, exact
+                elif flag == UPPER and value < beta:
+                    beta, complete = value, exact
+                if alpha >= beta:
+                    return value, [node], exact
+
+        alpha0, beta0 = alpha, beta
+        best = float('-inf') if is_maximizing else float('inf')
+        best_line, best_child = [], None
+        for child in self.moves.order(self.tree[node], ply, tt_move):
+            value, line, done = self._search(child, depth - 1, alpha, beta, not is_maximizing, ply + 1)
+            complete = complete and done
+            if is_maximizing:
+                if value > best:
+                    best, best_line, best_child = value, line, child
+                alpha = max(alpha, best)
+            else:
+                if value < best:
+                    best, best_line, best_child = value, line, child
+                beta = min(beta, best)
+            if ply == 0:
+                self.root_best = (best_child, best, [node] + best_line)
+            if alpha >= beta:
+                self.cutoffs += 1
+                self.moves.cutoff(child, ply, self.nodes - searched)
+                break
+
+        if best <= alpha0:
+            flag = UPPER
+        elif best >= beta0:
+            flag = LOWER
+        else:
+            flag = EXACT
+        table.store(key, INF if complete else depth, self.nodes - searched, best, flag, best_child)
+        return best, [node] + best_line, complete
+
+    def principal_line(self, node, is_maximizing):
+        # follow exact entries as far as the table still has them
+        line = []
+        while node is not None:
+            line.append(node)
+            if node not in self.tree:
+                break
+            entry = self.table.probe(self.table.key(node, is_maximizing))
+            if entry is None or entry[4] != EXACT:
+                break
+            node = entry[5]
+            is_maximizing = not is_maximizing
+        return line
+
+    def complete_line(self, line, value, is_maximizing, depth):
+        # every node on a principal variation has the root's value, so a line cut short
+        # by the table is extended by re-searching the last node's children for one
+        # that reaches it; the table makes these searches cheap. Under a deadline the
+        # line found so far is returned once it passes
+        while True:
+            node = line[-1]
+            remaining = depth - (len(line) - 1)
+            if node not in self.tree or not self.tree[node] or remaining <= 0:
+                break
+            side = is_maximizing if len(line) % 2 else not is_maximizing
+            best, best_value = None, None
+            try:
+                for child in self.moves.order(self.tree[node], len(line) - 1):
+                    v, sub, _ = self._search(child, remaining - 1, -INF, INF, not side, len(line))
+                    if v == value:
+                        best = sub
+                        break
+                    if best is None or (v > best_value if side else v < best_value):
+                        best, best_value = sub, v
+            except SearchTimeout:
+                break
+            line = line + best
+        return line
+
+    def solve(self, root, is_maximizing):
+        self.deadline = None
+        value, line, _ = self._search(root, INF, float('-inf'), float('inf'), is_maximizing, 0)
+        return value, self.complete_line(line, value, is_maximizing, INF)
+
+    def best_move(self, root, is_maximizing, time_limit=None, max_depth=None, stats=None):
+        # iterative deepening: each finished depth replaces the answer, and when the
+        # deadline interrupts a depth its best root move so far is kept, since the
+        # previous best is always searched first
+        started = time.perf_counter()
+        self.deadline = None if time_limit is None else started + time_limit
+        self.nodes = self.cutoffs = 0
+        move, value, line = None, None, [root]
+        depth, finished, line_depth, timed_out = 0, 0, 0, False
+        while max_depth is None or depth < max_depth:
+            depth += 1
+            self.root_best = None
+            try:
+                value, line, complete = self._search(root, depth, float('-inf'), float('inf'), is_maximizing, 0)
+            except SearchTimeout:
+                timed_out = True
+                if self.root_best is not None and self.root_best[0] is not None:
+                    move, value, line = self.root_best
+                    line_depth = depth
+                break
+            move = line[1] if len(line) > 1 else None
+            finished = line_depth = depth
+            if complete:
+                line_depth = INF
+                break
+        if value is not None:
+            line = self.complete_line(line, value, is_maximizing, line_depth)
+        self.deadline = None
+        if stats is not None:
+            stats.update(depth=finished, nodes=self.nodes, cutoffs=self.cutoffs, tt_hits=self.table.hits,
+                         timed_out=timed_out, seconds=time.perf_counter() - started)
+        return move, value, line
+
+def alphabeta(node, is_maximizing, tree, values, ordering="history", table_size=1 << 16, stats=None):
+    engine = MinimaxEngine(tree, values, ordering=ordering, table_size=table_size)
+    value, pv = engine.solve(node, is_maximizing)
+    if stats is not None:
+        stats.update(nodes=engine.nodes, cutoffs=engine.cutoffs, tt_hits=engine.table.hits)
+    return value, pv
+
+_engine = None
+_bound = None
+
+def _init_worker(tree, values, bound):
+    global _engine, _bound
+    _engine = MinimaxEngine(tree, values)
+    _bound = bound
+
+def _search_root_child(child, is_maximizing):
+    began = time.perf_counter()
+    nodes = _engine.nodes
+    # start from the best root value any worker has proven so far
+    bound = _bound.value
+    alpha, beta = (bound, INF) if is_maximizing else (-INF, bound)
+    value, line, _ = _engine._search(child, INF, alpha, beta, not is_maximizing, 1)
+    exact = value > bound if is_maximizing else value < bound
+    if exact:
+        with _bound.get_lock():
+            if (value > _bound.value) if is_maximizing else (value < _bound.value):
+                _bound.value = value
+    return {
+        "child": child,
+        "value": value,
+        "line": line,
+        "exact": exact,
+        "nodes": _engine.nodes - nodes,
+        "seconds": time.perf_counter() - began,
+    }
+
+def parallel_minimax(node, is_maximizing, tree, values, workers=None, stats=None):
+    # Young-Brothers-Wait at the root: the eldest child is searched serially to get
+    # a bound, then its brothers are split across processes sharing that bound
+    began = time.perf_counter()
+    children = tree.get(node, [])
+    if len(children) < 2:
+        value, line = alphabeta(node, is_maximizing, tree, values)
+        if stats is not None:
+            stats.update(seconds=time.perf_counter() - began, children=[])
+        return value, line
+
+    engine = MinimaxEngine(tree, values)
+    eldest = children[0]
+    value, line, _ = engine._search(eldest, INF, -INF, INF, not is_maximizing, 1)
+    best, best_line = value, [node] + line
+    results = [{"child": eldest, "value": value, "line": line, "exact": True,
+                "nodes": engine.nodes, "seconds": time.perf_counter() - began}]
+
+    bound = mp.Value('d', best)
+    workers = min(workers or os.cpu_count() or 1, len(children) - 1)
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(tree, values, bound)) as pool:
+        futures = [pool.submit(_search_root_child, child, is_maximizing) for child in children[1:]]
+        for future in as_completed(futures):
+            results.append(future.result())
+
+    # a brother that failed low only proved an upper bound; the true best is always
+    # among the exact results, so those are the only ones merged
+    for res in results:
+        if res["exact"] and ((res["value"] > best) if is_maximizing else (res["value"] < best)):
+            best, best_line = res["value"], [node] + res["line"]
+    # a worker's table can cut its line short; rare, and then only that tail is re-searched here
+    best_line = engine.complete_line(best_line, best, is_maximizing, INF)
+    if stats is not None:
+        stats.update(seconds=time.perf_counter() - began, workers=workers,
+                     nodes=sum(r["nodes"] for r in results), children=results)
+    return best, best_line
+
+def input_game():
+    n = int(input("Enter the number of edges in the tree: "))
+    tree = {}
+    print("Enter the edges (parent child) one per line :")
+
+    for _ in range (n):
+        u, v = input().split()
+        tree.setdefault(u, []).append(v)
+
+    leaf_count = int(input("Enter the number of leaf nodes: "))
+    values = {}
+    print("Enter leaf node values one per line: ")
+    for _ in range (leaf_count):
+        node, val = input(). split()
+        values[node] = int(val)
+    return tree, values
+
+def main():
+    tree, values = input_game()
+    root = input("Enter the root node: ")
+    mode = input("Search mode (serial/parallel, default serial): ").strip() or "serial"
+    limit = "" if mode == "parallel" else input("Time limit per move in seconds (blank for full search): ").strip()
+    if mode == "parallel":
+        began = time.perf_counter()
+        serial, _ = alphabeta(root, True, tree, values)
+        serial_seconds = time.perf_counter() - began
+        stats = {}
+        result, line = parallel_minimax(root, True, tree, values, stats=stats)
+        print(f"Serial {serial_seconds:.4f}s, parallel {stats['seconds']:.4f}s,",
+              f"speedup {serial_seconds / max(stats['seconds'], 1e-9):.2f}x")
+        if serial != result:
+            print("Warning: parallel value differs from the serial search")
+    elif limit:
+        stats = {}
+        move, result, line = MinimaxEngine(tree, values).best_move(root, True, float(limit), stats=stats)
+        print("Best move:", move, "(depth", stats["depth"], ")")
+    else:
+        result, line = alphabeta(root, True, tree, values)
+    print("Optimal value: ", result)
+    print("Principal variation:", " -> ".join(line))
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
@@ -0,0 +1,63 @@
+import random
+import time
+
+IMPROVEMENT_EPS = 1e-9
+
+def swap_delta(tour, dist, i, j):
+    n = len(tour)
+    if i == j or n < 3:
+        return 0
+    if i > j:
+        i, j = j, i
+
+    a, b = tour[i], tour[j]
+    if j == i + 1:
+        # a -> b are consecutive: p a b s becomes p b a s
+        p, s = tour[i - 1], tour[(j + 1) % n]
+        old = dist[p][a] + dist[a][b] + dist[b][s]
+        new = dist[p][b] + dist[b][a] + dist[a][s]
+    elif i == 0 and j == n - 1:
+        # b -> a wrap around the end: r b a q becomes r a b q
+        r, q = tour[j - 1], tour[i + 1]
+        old = dist[r][b] + dist[b][a] + dist[a][q]
+        new = dist[r][a] + dist[a][b] + dist[b][q]
+    else:
+        p, q = tour[i - 1], tour[i + 1]
+        r, s = tour[j - 1], tour[(j + 1) % n]
+        old = dist[p][a] + dist[a][q] + dist[r][b] + dist[b][s]
+        new = dist[p][b] + dist[b][q] + dist[r][a] + dist[a][s]
+    return new - old
+
+def out_of_time(deadline):
+    # deadline is a time.monotonic() value, shared by every process on the machine
+    return deadline is not None and time.monotonic() >= deadline
+
+def apply_swap(tour, i, j):
+    tour[i], tour[j] = tour[j], tour[i]
+
+def swap_moves(n, order="sequential", start=None, rng=random):
+    if order == "random":
+        rows = list(range(n - 1))
+        rng.shuffle(rows)
+        for i in rows:
+            cols = list(range(i + 1, n))
+            rng.shuffle(cols)
+            for j in cols:
+                yield i, j
+        return
+    if order not in ("sequential", "resume"):
+        raise ValueError(f"Unknown move order: {order}")
+
+    i0, j0 = 0, 1
+    if order == "resume" and start is not None:
+        i0, j0 = start
+        if not 0 <= i0 < j0 < n:
+            i0, j0 = 0, 1
+
+    for i in range(i0, n - 1):
+        for j in range(j0 if i == i0 else i + 1, n):
+            yield i, j
+    # wrap around to the pairs before the resume point
+    for i in range(0, i0 + 1):
+        for j in range(i + 1, j0 if i == i0 else n):
+            yield i, j
\ No newline at end of file
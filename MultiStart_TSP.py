@@ -0,0 +1,126 @@
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED, ALL_COMPLETED
+from multiprocessing import shared_memory
+from HillClimbing_TSP import input_tsp, simple_hill_climbing
+from SA_HillClimbing_TSP import steepest_ascent_hill_climbing
+from Stochastic_HC_TSP import stochastic_hill_climbing
+from LocalSearch_TSP import local_search
+from Construction_TSP import nearest_neighbor_matrix_tour
+
+CLIMBERS = {
+    "simple": simple_hill_climbing,
+    "steepest": steepest_ascent_hill_climbing,
+    "stochastic": stochastic_hill_climbing,
+    "local": local_search,
+}
+
+_shm = None
+_dist = None
+
+def _init_worker(shm_name, n):
+    global _shm, _dist
+    _shm = shared_memory.SharedMemory(name=shm_name)
+    # one zero-copy float view per row, so dist[a][b] stays a plain float lookup
+    flat = _shm.buf.cast("d")
+    _dist = [flat[i * n:(i + 1) * n] for i in range(n)]
+
+def _restart(climber, seed, initial, options, deadline=None, max_evaluations=None):
+    began = time.perf_counter()
+    random.seed(seed)
+    if initial == "nearest":
+        start_tour = nearest_neighbor_matrix_tour(_dist, random.randrange(len(_dist)))
+    else:
+        start_tour = list(range(len(_dist)))
+        random.shuffle(start_tour)
+    stats = {}
+    result = CLIMBERS[climber](_dist, start_tour, stats=stats, deadline=deadline,
+                               max_evaluations=max_evaluations, **options)
+    return {
+        "seed": seed,
+        "cost": result[1],
+        "tour": list(result[0]),
+        "evaluations": stats.get("evaluations", 0),
+        "seconds": time.perf_counter() - began,
+    }
+
+def multi_start(dist, climber="simple", restarts=100, workers=None, time_limit=None,
+                max_evaluations=None, seed=None, initial="random", **options):
+    n = len(dist)
+    workers = workers or os.cpu_count() or 1
+    seeds = random.Random(seed)
+    deadline = None if time_limit is None else time.monotonic() + time_limit
+
+    shm = shared_memory.SharedMemory(create=True, size=max(n * n * 8, 8))
+    flat = shm.buf.cast("d")
+    for i in range(n):
+        flat[i * n:(i + 1) * n] = array("d", dist[i])
+
+    results = []
+    evaluations = 0
+    pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(shm.name, n))
+    try:
+        pending = set()
+        caps = {}
+        submitted = 0
+        while True:
+            exhausted = (max_evaluations is not None and evaluations >= max_evaluations) or \
+                        (deadline is not None and time.monotonic() >= deadline)
+            # keep only a couple of restarts per worker queued so a budget stop cancels cheaply
+            while not exhausted and submitted < restarts and len(pending) < 2 * workers:
+                cap = None
+                if max_evaluations is not None:
+                    # share the unreserved budget over the free slots; a restart that
+                    # stops under its cap hands the rest back for later ones
+                    free = max_evaluations - evaluations - sum(caps.values())
+                    if free <= 0:
+                        break
+                    cap = -(-free // (2 * workers - len(pending)))
+                future = pool.submit(_restart, climber, seeds.getrandbits(32), initial, options,
+                                     deadline, cap)
+                caps[future] = cap or 0
+                pending.add(future)
+                submitted += 1
+            if exhausted:
+                # queued restarts are dropped; running ones stop at the deadline or their
+                # evaluation cap, so wait for them and keep what they found
+                for future in pending:
+                    future.cancel()
+            if not pending:
+                break
+            timeout = None if deadline is None or exhausted else max(0.0, deadline - time.monotonic())
+            done, pending = wait(pending, timeout=timeout,
+                                 return_when=ALL_COMPLETED if exhausted else FIRST_COMPLETED)
+            for future in done:
+                caps.pop(future)
+                if future.cancelled():
+                    continue
+                res = future.result()
+                results.append(res)
+                evaluations += res["evaluations"]
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=True, cancel_futures=True)
+        del flat
+        shm.close()
+        shm.unlink()
+
+    if not results:
+        return None, float('inf'), []
+    best = min(results, key=lambda r: r["cost"])
+    return best["tour"], best["cost"], results
+
+if __name__ == "__main__":
+    dist = input_tsp()
+    climber = input("Enter climber (simple/steepest/stochastic/local, default simple): ") or "simple"
+    restarts = int(input("Enter number of restarts (default 100): ") or "100")
+    limit = input("Enter time limit in seconds (blank for none): ")
+    initial = input("Enter start tours (random/nearest, default random): ") or "random"
+    tour, cost, runs = multi_start(dist, climber, restarts, time_limit=float(limit) if limit else None,
+                                   initial=initial)
+    print(f"\nCompleted {len(runs)} restarts")
+    print("Restart costs:", [round(r["cost"], 4) for r in runs])
+    print("\nBest multi-start tour:", tour, "\ncost =", cost)
\ No newline at end of file
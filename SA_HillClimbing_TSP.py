@@ -1,4 +1,5 @@
 import random
+from Moves_TSP import IMPROVEMENT_EPS, swap_delta, apply_swap, swap_moves, out_of_time
 
 def input_tsp():
     n = int(input("Enter number of cities: "))
@@ -17,34 +18,43 @@ def tour_cost(tour, dist):
         cost += dist[tour[i]][tour[j]]
     return cost
 
-def two_opt_neighbors(tour):
-    neighbors = []
-    n = len(tour)
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            nbr = tour.copy()
-            nbr[i], nbr[j] = nbr[j], nbr[i]
-            neighbors.append(nbr)
-    return neighbors
-
-def steepest_ascent_hill_climbing(dist, start_tour):
-    current = start_tour
+def two_opt_neighbors(tour, order="sequential"):
+    for i, j in swap_moves(len(tour), order):
+        nbr = tour.copy()
+        nbr[i], nbr[j] = nbr[j], nbr[i]
+        yield nbr
+
+def steepest_ascent_hill_climbing(dist, start_tour, stats=None, deadline=None, max_evaluations=None):
+    current = list(start_tour)
     current_cost = tour_cost(current, dist)
     path = [current_cost]
 
+    n = len(current)
+    evaluations = 0
+    limit = float('inf') if max_evaluations is None else max_evaluations
     while True:
-        best_nbr = None
-        best_cost = current_cost
-        for nbr in two_opt_neighbors(current):
-            c = tour_cost(nbr, dist)
-            if c < best_cost:
-                best_cost = c
-                best_nbr = nbr
-        if best_nbr is None:
+        best_move = None
+        best_delta = -IMPROVEMENT_EPS
+        stopped = False
+        for i, j in swap_moves(n):
+            # checked once per row; stopping mid-scan keeps the current tour
+            if j == i + 1:
+                if evaluations + n - 1 - i > limit or out_of_time(deadline):
+                    stopped = True
+                    break
+                evaluations += n - 1 - i
+            delta = swap_delta(current, dist, i, j)
+            if delta < best_delta:
+                best_delta = delta
+                best_move = (i, j)
+        if best_move is None or stopped:
             break
-        current, current_cost = best_nbr, best_cost
+        apply_swap(current, *best_move)
+        current_cost += best_delta
         path.append(current_cost)
 
+    if stats is not None:
+        stats["evaluations"] = evaluations
     return current, current_cost, path
 
 if __name__ == "__main__":
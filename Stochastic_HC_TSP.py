@@ -1,4 +1,5 @@
 import random
+from Moves_TSP import IMPROVEMENT_EPS, swap_delta, apply_swap, swap_moves, out_of_time
 
 def input_tsp():
     n = int(input("Enter number of cities: "))
@@ -17,33 +18,46 @@ def tour_cost(tour, dist):
         cost += dist[tour[i]][tour[j]]
     return cost
 
-def two_opt_neighbors(tour):
-    neighbors = []
-    n = len(tour)
-    for i in range(n - 1):
-        for j in range(i + 1, n):
-            nbr = tour.copy()
-            nbr[i], nbr[j] = nbr[j], nbr[i]
-            neighbors.append(nbr)
-    return neighbors
-
-def stochastic_hill_climbing(dist, start_tour, max_iters=1000):
-    current = start_tour
+def two_opt_neighbors(tour, order="sequential"):
+    for i, j in swap_moves(len(tour), order):
+        nbr = tour.copy()
+        nbr[i], nbr[j] = nbr[j], nbr[i]
+        yield nbr
+
+def stochastic_hill_climbing(dist, start_tour, max_iters=1000, order="sequential", stats=None, deadline=None,
+                             max_evaluations=None):
+    current = list(start_tour)
     current_cost = tour_cost(current, dist)
     path = [current_cost]
 
+    n = len(current)
+    evaluations = 0
+    limit = float('inf') if max_evaluations is None else max_evaluations
     for _ in range(max_iters):
-        better = []
-        for nbr in two_opt_neighbors(current):
-            c = tour_cost(nbr, dist)
-            if c < current_cost:
-                better.append((nbr, c))
-        if not better:
+        # reservoir sampling: uniform choice among improving moves without storing them
+        chosen = None
+        seen = 0
+        stopped = False
+        for i, j in swap_moves(n, order):
+            if j == i + 1:
+                if evaluations + n - 1 - i > limit or out_of_time(deadline):
+                    stopped = True
+                    break
+                evaluations += n - 1 - i
+            delta = swap_delta(current, dist, i, j)
+            if delta < -IMPROVEMENT_EPS:
+                seen += 1
+                if random.randrange(seen) == 0:
+                    chosen = (i, j, delta)
+        if chosen is None or stopped:
             break
-        nbr, c = random.choice(better)
-        current, current_cost = nbr, c
+        i, j, delta = chosen
+        apply_swap(current, i, j)
+        current_cost += delta
         path.append(current_cost)
 
+    if stats is not None:
+        stats["evaluations"] = evaluations
     return current, current_cost, path
 
 if __name__ == "__main__":
@@ -0,0 +1,38 @@
+import random
+from A_star import AStarEngine, a_star
+from Landmarks import Landmarks, dijkstra
+
+def random_tree(rng, n):
+    names = [f"n{i}" for i in range(n)]
+    return {u: [(v, rng.randint(1, 9)) for v in rng.sample(names, rng.randint(0, 3))] for u in names}
+
+def path_cost(tree, path):
+    return sum(dict(tree[a])[b] for a, b in zip(path, path[1:]))
+
+def test_cached_answers_match_fresh_searches():
+    rng = random.Random(7)
+    for _ in range(20):
+        tree = random_tree(rng, 25)
+        h = Landmarks.build(tree, 3, seed=1).heuristic
+        engine = AStarEngine(tree, h)
+        queries = [(rng.choice(list(tree)), rng.choice(list(tree))) for _ in range(200)]
+        for start, goal in queries + queries:
+            assert engine.query(start, goal) == a_star(engine.graph, start, goal, heuristic=h)
+
+def test_consistent_engine_reuses_trees_and_stays_optimal():
+    rng = random.Random(11)
+    for _ in range(20):
+        tree = random_tree(rng, 25)
+        engine = AStarEngine(tree, lambda a, b: 0, consistent=True)
+        graph = engine.graph
+        for start in tree:
+            dist = dijkstra(graph, graph.id(start))
+            for goal in tree:
+                path = engine.query(start, goal)
+                expected = dist[graph.id(goal)]
+                if path is None:
+                    assert expected == float('inf')
+                else:
+                    assert path[0] == start and path[-1] == goal
+                    assert path_cost(tree, path) == expected
+        assert engine.stats["tree_hits"] > 0
\ No newline at end of file